@@ -0,0 +1,21 @@
+# _html_utils.py
+from __future__ import annotations
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml  # noqa: F401
+    BS_PARSER = "lxml"
+except ImportError:
+    BS_PARSER = "html.parser"  # Fallback if lxml is missing
+
+
+def as_soup(html: str | BeautifulSoup | None) -> BeautifulSoup:
+    """Return `html` as a parsed tree, reusing it when it is already one.
+
+    Lets the page extractors take either the raw HTML or a tree the caller
+    parsed once and shares between them.
+    """
+    if isinstance(html, BeautifulSoup):
+        return html
+    return BeautifulSoup(html or "", BS_PARSER)
@@ -5,13 +5,15 @@ import re
 from urllib.parse import urlparse
 from pdf_export import export_audit_pdf
 from client_narrative import build_client_narrative
-from social_signals import extract_social_signals
-from share_meta import extract_share_meta
+from _html_utils import as_soup
+from signal_runner import submit_signals
 from net_guardrails import (
     DEFAULT_HEADERS,
     DEFAULT_TIMEOUT,
     MAX_HTML_BYTES,
     MAX_REDIRECTS,
+    cache_robots,
+    get_cached_robots,
     ignore_robots,
     parse_robots,
     read_limited_text,
@@ -66,7 +68,10 @@ def _robots_allows_url(url: str) -> bool:
     base = _site_root(url)
     if not base:
         return True
-    robots_url = f"{base}/robots.txt"
+    rules = get_cached_robots(base)
+    if rules is not None:
+        disallowed, _ = robots_disallows(url, rules)
+        return not disallowed
     robots_url = f"{base}/robots.txt"
     try:
         session = safe_session()
@@ -77,13 +82,15 @@ def _robots_allows_url(url: str) -> bool:
         if too_large or status != 200:
             return True
         rules = parse_robots(text)
+        cache_robots(base, rules)
         disallowed, _ = robots_disallows(url, rules)
         return not disallowed
     except Exception:
         return True
 
 
-def fetch_html(url: str) -> tuple[str, dict]:
+def fetch_html(url: str, on_chunk=None) -> tuple[str, dict]:
+    # `on_chunk` sees each raw body chunk as it arrives (e.g. TechDetector.feed).
     # Use safe_session for DNS Pinning / SSRF protection
     session = safe_session()
     session.max_redirects = MAX_REDIRECTS
@@ -98,7 +105,7 @@ def fetch_html(url: str) -> tuple[str, dict]:
         except ValueError: # safe_fetch raises ValueError on private IP
              raise FetchGuardrailError("invalid_url_or_private_ip")
         
-        text, too_large = read_limited_text(resp, MAX_HTML_BYTES)
+        text, too_large = read_limited_text(resp, MAX_HTML_BYTES, on_chunk=on_chunk)
         if too_large:
             raise FetchGuardrailError("too_large")
         resp.raise_for_status()
@@ -111,8 +118,9 @@ def normalize_text(s: str) -> str:
     return re.sub(r"\s+", " ", s).strip().lower()
 
 
-def page_signals(html: str) -> dict:
-    soup = BeautifulSoup(html, "html.parser")
+def page_signals(html: str | BeautifulSoup) -> dict:
+    # Accepts an already parsed tree so build_all_signals can share one parse.
+    soup = html if isinstance(html, BeautifulSoup) else BeautifulSoup(html, "html.parser")
     text = normalize_text(soup.get_text(" ", strip=True))
 
     clickable_texts = []
@@ -155,19 +163,28 @@ def page_signals(html: str) -> dict:
 
 
 
-def build_all_signals(html: str, page_url: str | None = None, headers: dict | None = None) -> dict:
+def build_all_signals(
+    html: str, page_url: str | None = None, headers: dict | None = None, tech_stack: dict | None = None
+) -> dict:
     """
     Returns a single dict containing:
     - conversion clarity signals from page_signals()
     - social presence signals from extract_social_signals()
     - share preview metadata from extract_share_meta() (Open Graph + Twitter cards)
 
+    `tech_stack` is an already computed detect_tech_stack() result (e.g. from a
+    TechDetector fed during fetch_html); when given, the HTML is not rescanned.
+
     Deterministic, no external social APIs.
     """
-    base = page_signals(html)
+    # Parse once; share_meta and social run on the signal_runner pool while
+    # the page signals are computed here from the same tree.
+    soup = as_soup(html)
+    pending = submit_signals(soup, page_url=page_url)
+    base = page_signals(soup)
 
     try:
-        social = extract_social_signals(html)
+        social = pending["social"].result()
     except Exception as e:
         # Conservative fallback: never break the audit because social parsing failed.
         social = {
@@ -188,7 +205,7 @@ def build_all_signals(html: str, page_url: str | None = None, headers: dict | No
 
     # Share preview meta (Open Graph / Twitter). Stored as a nested dict to keep signals readable.
     try:
-        combined["share_meta"] = extract_share_meta(html, page_url=page_url)
+        combined["share_meta"] = pending["share_meta"].result()
     except Exception as e:
         combined["share_meta"] = {"error": str(e)}
 
@@ -200,13 +217,15 @@ def build_all_signals(html: str, page_url: str | None = None, headers: dict | No
         import security_sentry
 
         # 1. Tech Stack
-        combined["tech_stack"] = tech_detective.detect_tech_stack(html, headers or {}) 
+        if tech_stack is None:
+            tech_stack = tech_detective.detect_tech_stack(html, headers or {})
+        combined["tech_stack"] = tech_stack
         
         # 2. Accessibility
         combined["a11y_report"] = accessibility_heuristic.audit_a11y(html)
         
         # 3. Copy Quality (extract text first)
-        soup_text = BeautifulSoup(html, "html.parser").get_text(" ", strip=True)
+        soup_text = soup.get_text(" ", strip=True)
         combined["content_quality"] = copy_critic.analyze_copy(soup_text)
 
         # 4. Security headers / trust signals
@@ -31,6 +31,7 @@ from conversion_loss_findings import build_conversion_loss, build_conversion_los
 from indexability_signals import extract_indexability_signals, INDEXABILITY_PACK_VERSION
 from indexability_findings import build_indexability_findings
 from crawl_v1 import crawl_site
+from tech_detective import TechDetector
 
 from client_narrative import build_client_narrative
 from pdf_export import export_audit_pdf
@@ -58,27 +59,42 @@ CRITICAL_FINDING_IDS = {
 CRITICAL_SEVERITIES = {"critical", "warning"}
 
 
-def _capture_visual_evidence(url: str, evidence_dir: str) -> None:
+def _open_visual_pool():
+    """Starts the shared visual capture pool, or returns None when disabled."""
     if os.environ.get("SCOPE_DISABLE_VISUAL") == "1":
-        return
+        return None
     try:
-        from visual_engine import VisualVerifier, PLAYWRIGHT_AVAILABLE
+        from visual_engine import VisualVerifierPool, PLAYWRIGHT_AVAILABLE
     except Exception:
-        return
+        return None
 
     if not PLAYWRIGHT_AVAILABLE:
-        return
+        return None
+
+    # Desktop and mobile captures of a target run side by side.
+    pool = VisualVerifierPool(size=2, headless=True, cache_dir=config.VISUAL_CACHE_DIR or None)
+    pool.start()
+    return pool
+
+
+def _capture_visual_evidence(url: str, evidence_dir: str, pool=None) -> None:
+    owned = pool is None
+    if owned:
+        pool = _open_visual_pool()
+        if pool is None:
+            return
 
     try:
         os.makedirs(evidence_dir, exist_ok=True)
         perf = {}
-        with VisualVerifier(headless=True) as vv:
-            desktop = vv.capture(url, Path(evidence_dir) / "home.png", device_type="desktop")
-            mobile = vv.capture(url, Path(evidence_dir) / "home_mobile.png", device_type="mobile")
-            if isinstance(desktop, dict):
-                perf["desktop"] = desktop.get("metrics", {}) or {}
-            if isinstance(mobile, dict):
-                perf["mobile"] = mobile.get("metrics", {}) or {}
+        desktop, mobile = pool.capture_many([
+            (url, Path(evidence_dir) / "home.jpg", "desktop"),
+            (url, Path(evidence_dir) / "home_mobile.jpg", "mobile"),
+        ])
+        if isinstance(desktop, dict):
+            perf["desktop"] = desktop.get("metrics", {}) or {}
+        if isinstance(mobile, dict):
+            perf["mobile"] = mobile.get("metrics", {}) or {}
 
         if perf:
             perf_path = os.path.join(evidence_dir, "performance.json")
@@ -88,6 +104,9 @@ def _capture_visual_evidence(url: str, evidence_dir: str) -> None:
     except Exception:
         # Visual capture is best-effort; never fail the audit for it.
         return
+    finally:
+        if owned:
+            pool.close()
 
 def classify_audit(mode: str, findings: list[dict]) -> tuple[str, str]:
     """
@@ -606,7 +625,9 @@ def audit_one(url: str, lang: str, business_inputs: dict | None = None, max_page
         u = "https://" + u
 
     try:
-        html, headers = fetch_html(u)
+        # Tech signatures are matched while the body downloads.
+        detector = TechDetector()
+        html, headers = fetch_html(u, on_chunk=detector.feed)
         try:
             crawl_payload = crawl_site(u, analysis_mode=analysis_mode, max_pages=max_pages)
         except Exception as crawl_exc:
@@ -622,7 +643,7 @@ def audit_one(url: str, lang: str, business_inputs: dict | None = None, max_page
                 "fallback_triggered": False,
                 "fallback_threshold": 5,
             }
-        signals = build_all_signals(html, page_url=u, headers=headers)
+        signals = build_all_signals(html, page_url=u, headers=headers, tech_stack=detector.result(headers))
         idx_signals = extract_indexability_signals(url=u, html=html, signals=signals)
         signals["indexability"] = idx_signals
 
@@ -879,102 +900,107 @@ def main():
     collected_rows = []
 
     tool_version = get_tool_version()
-    for i, t in enumerate(targets, start=1):
-        client_name = t["client_name"]
-        url = t["url"]
-        start_time = time.perf_counter()
-
-        logger.info(f"[{i}/{total}] Processing: {url} (Client: {client_name})")
-
-        result = audit_one(url, lang=lang, business_inputs=business_inputs)
-        result["client_name"] = client_name
-        result["tool_version"] = tool_version
-        result["evidence_pack"] = _build_evidence_pack(
-            result.get("crawl_v1") or {},
-            result.get("evidence_pack"),
-        )
-
-        ai_advisory = build_ai_advisory(result)
-        if ai_advisory:
-            result["ai_advisory"] = ai_advisory
+    visual_pool = _open_visual_pool()
+    try:
+        for i, t in enumerate(targets, start=1):
+            client_name = t["client_name"]
+            url = t["url"]
+            start_time = time.perf_counter()
+
+            logger.info(f"[{i}/{total}] Processing: {url} (Client: {client_name})")
+
+            result = audit_one(url, lang=lang, business_inputs=business_inputs)
+            result["client_name"] = client_name
+            result["tool_version"] = tool_version
+            result["evidence_pack"] = _build_evidence_pack(
+                result.get("crawl_v1") or {},
+                result.get("evidence_pack"),
+            )
 
-        base = slugify(client_name) if client_name else slug_from_url(result["url"])
-        client_folder = os.path.join(reports_root, base)
-        run_folder = dt.datetime.now().strftime("%Y-%m-%d")
-        out_folder = os.path.join(client_folder, run_folder)
-        os.makedirs(out_folder, exist_ok=True)
+            ai_advisory = build_ai_advisory(result)
+            if ai_advisory:
+                result["ai_advisory"] = ai_advisory
 
-        # SAVE EVIDENCE
-        if result.get("mode") == "ok":
-            evidence_dir = os.path.join(out_folder, "evidence")
-            save_html_evidence(result.get("html", ""), evidence_dir, "home.html")
-            _capture_visual_evidence(url, evidence_dir)
+            base = slugify(client_name) if client_name else slug_from_url(result["url"])
+            client_folder = os.path.join(reports_root, base)
+            run_folder = dt.datetime.now().strftime("%Y-%m-%d")
+            out_folder = os.path.join(client_folder, run_folder)
+            os.makedirs(out_folder, exist_ok=True)
 
-        pdf_path = os.path.join(out_folder, f"audit_{lang}.pdf")
-        json_path = os.path.join(out_folder, f"audit_{lang}.json")
+            # SAVE EVIDENCE
+            if result.get("mode") == "ok":
+                evidence_dir = os.path.join(out_folder, "evidence")
+                save_html_evidence(result.get("html", ""), evidence_dir, "home.html")
+                _capture_visual_evidence(url, evidence_dir, visual_pool)
 
-        save_json(result, json_path)
-        logger.info(f"  Saved JSON: {json_path}")
+            pdf_path = os.path.join(out_folder, f"audit_{lang}.pdf")
+            json_path = os.path.join(out_folder, f"audit_{lang}.json")
 
-        try:
-            export_audit_pdf(result, pdf_path, tool_version=tool_version)
-            logger.info(f"  Saved PDF:  {pdf_path}")
-        except Exception as e:
-            logger.error(f"  PDF export failed for {url}: {e}")
-            import traceback
-            traceback.print_exc()
+            save_json(result, json_path)
+            logger.info(f"  Saved JSON: {json_path}")
 
-        if proof_spec == "shadow":
-            shadow_path = os.path.join(out_folder, "proof_completeness_shadow.json")
             try:
-                write_proof_completeness_shadow(result.get("findings", []), shadow_path)
-                logger.info(f"  Saved Shadow Proof: {shadow_path}")
-            except Exception as px:
-                logger.warning(f"  Shadow proof write failed for {url}: {px}")
-
-        signals = result.get("signals", {}) or {}
-        signals = result.get("signals", {}) or {}
-
-        display = result.get("url", "<unknown>")
-        mode = result.get("mode", "unknown")
-        missing_target = not (url or "").strip() or display == "(no website)"
-        status = "BROKEN" if missing_target else ("OK" if mode == "ok" else ("BROKEN" if mode == "broken" else "UNKNOWN"))
-        duration = time.perf_counter() - start_time
-        if status == "OK":
-            ok_count += 1
-        elif status == "BROKEN":
-            broken_count += 1
-        else:
-            unknown_count += 1
-
-        print(f"[{i}/{total}] {display}")
-        print(f"  status: {status}")
-        print(f"  pdf:   {pdf_path}")
-        print(f"  json:  {json_path}")
-        evidence_path = os.path.join(out_folder, "evidence")
-        if os.path.isdir(evidence_path):
-            print(f"  ev:    {evidence_path}")
-        print(f"  time:  {duration:.1f}s")
-
-        # If broken mode includes a traceback, write it next to the outputs for debugging.
-        tb = ((result.get("signals") or {}).get("traceback"))
-        if tb:
-            with open(os.path.join(out_folder, "error_traceback.txt"), "w", encoding="utf-8") as f:
-               f.write(tb)
-
-        # Collect CSV row
-        narrative = result.get("client_narrative") or {}
-        primary = narrative.get("primary_issue")
-        p_title = primary.get("title", "") if isinstance(primary, dict) else str(primary)
+                export_audit_pdf(result, pdf_path, tool_version=tool_version)
+                logger.info(f"  Saved PDF:  {pdf_path}")
+            except Exception as e:
+                logger.error(f"  PDF export failed for {url}: {e}")
+                import traceback
+                traceback.print_exc()
+
+            if proof_spec == "shadow":
+                shadow_path = os.path.join(out_folder, "proof_completeness_shadow.json")
+                try:
+                    write_proof_completeness_shadow(result.get("findings", []), shadow_path)
+                    logger.info(f"  Saved Shadow Proof: {shadow_path}")
+                except Exception as px:
+                    logger.warning(f"  Shadow proof write failed for {url}: {px}")
+
+            signals = result.get("signals", {}) or {}
+            signals = result.get("signals", {}) or {}
+
+            display = result.get("url", "<unknown>")
+            mode = result.get("mode", "unknown")
+            missing_target = not (url or "").strip() or display == "(no website)"
+            status = "BROKEN" if missing_target else ("OK" if mode == "ok" else ("BROKEN" if mode == "broken" else "UNKNOWN"))
+            duration = time.perf_counter() - start_time
+            if status == "OK":
+                ok_count += 1
+            elif status == "BROKEN":
+                broken_count += 1
+            else:
+                unknown_count += 1
+
+            print(f"[{i}/{total}] {display}")
+            print(f"  status: {status}")
+            print(f"  pdf:   {pdf_path}")
+            print(f"  json:  {json_path}")
+            evidence_path = os.path.join(out_folder, "evidence")
+            if os.path.isdir(evidence_path):
+                print(f"  ev:    {evidence_path}")
+            print(f"  time:  {duration:.1f}s")
+
+            # If broken mode includes a traceback, write it next to the outputs for debugging.
+            tb = ((result.get("signals") or {}).get("traceback"))
+            if tb:
+                with open(os.path.join(out_folder, "error_traceback.txt"), "w", encoding="utf-8") as f:
+                   f.write(tb)
+
+            # Collect CSV row
+            narrative = result.get("client_narrative") or {}
+            primary = narrative.get("primary_issue")
+            p_title = primary.get("title", "") if isinstance(primary, dict) else str(primary)
         
-        row = {
-            "domain": display,
-            "score": signals.get("score", 0),
-            "mode": mode,
-            "primary_issue": p_title,
-            "confidence": narrative.get("confidence", ""),
-        }
-        collected_rows.append(row)
+            row = {
+                "domain": display,
+                "score": signals.get("score", 0),
+                "mode": mode,
+                "primary_issue": p_title,
+                "confidence": narrative.get("confidence", ""),
+            }
+            collected_rows.append(row)
+    finally:
+        if visual_pool is not None:
+            visual_pool.close()
 
     # Write deterministic CSV
     if collected_rows:
@@ -15,3 +15,5 @@ LOG_LEVEL = os.getenv("AUDIT_LOG_LEVEL", "INFO").upper()
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 ASSETS_DIR = os.path.join(BASE_DIR, "assets")
 FONTS_DIR = os.path.join(ASSETS_DIR, "fonts")
+# Persistent browser profiles for visual captures; empty keeps them ephemeral.
+VISUAL_CACHE_DIR = os.getenv("AUDIT_VISUAL_CACHE_DIR", "")
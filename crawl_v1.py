@@ -15,6 +15,7 @@ from net_guardrails import (
     MAX_HTML_BYTES,
     MAX_REDIRECTS,
     ignore_robots,
+    parse_xml,
     parse_robots,
     read_limited_text,
     redact_headers,
@@ -24,11 +25,6 @@ from net_guardrails import (
 from safe_fetch import safe_session
 import signal_detector
 
-try:
-    from defusedxml import ElementTree as ET
-except ImportError:
-    import xml.etree.ElementTree as ET # Fallback if defusedxml is missing
-
 HEADERS = DEFAULT_HEADERS
 
 HARD_CAP_DISCOVERED = 2000
@@ -358,7 +354,7 @@ def _robots_allows(url: str, policy: dict) -> tuple[bool, str | None]:
 
 
 def _parse_sitemap_xml(body: str) -> tuple[list[str], str]:
-    root = ET.fromstring(body)
+    root = parse_xml(body)
     tag = root.tag.lower()
     kind = "urlset"
     if "sitemapindex" in tag:
@@ -3,16 +3,12 @@ from __future__ import annotations
 
 from typing import Any
 from urllib.parse import urljoin, urlparse
-try:
-    from defusedxml import ElementTree as ET
-except ImportError:
-    import xml.etree.ElementTree as ET # Fallback if defusedxml is missing
 
 import requests
 from bs4 import BeautifulSoup
 
 from audit import HEADERS, BOOKING_KEYWORDS, CONTACT_KEYWORDS, normalize_text
-from net_guardrails import DEFAULT_TIMEOUT, MAX_HTML_BYTES, MAX_REDIRECTS, read_limited_text, redact_headers, robots_disallows, ignore_robots
+from net_guardrails import DEFAULT_TIMEOUT, MAX_HTML_BYTES, MAX_REDIRECTS, parse_xml, read_limited_text, redact_headers, robots_disallows, ignore_robots
 
 INDEXABILITY_PACK_VERSION = "v1"
 
@@ -541,7 +537,7 @@ def _parse_sitemap_fetch(status: int | None, error: str | None, body: str) -> di
 
 
 def _parse_sitemap_xml(body: str) -> tuple[list[str], str]:
-    root = ET.fromstring(body)
+    root = parse_xml(body)
     tag = root.tag.lower()
     kind = "urlset"
     if "sitemapindex" in tag:
@@ -1,18 +1,32 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Mapping
+import time
+from typing import Any, Callable, Mapping
 from urllib.parse import urlparse
 import socket
 import ipaddress
 
+try:
+    from defusedxml import ElementTree as _ET
+    # Sitemaps never carry a DTD, so reject one outright on top of defusedxml's
+    # default entity/external-reference checks.
+    SAFE_XML_KWARGS = {"forbid_dtd": True, "forbid_entities": True, "forbid_external": True}
+except ImportError:
+    import xml.etree.ElementTree as _ET # Fallback if defusedxml is missing
+    SAFE_XML_KWARGS = {}
+
 DEFAULT_USER_AGENT = "SCOPE/1.0 (+contact@astra.example)"
 DEFAULT_HEADERS = {"User-Agent": DEFAULT_USER_AGENT}
 DEFAULT_TIMEOUT = 15
 MAX_HTML_BYTES = 2 * 1024 * 1024
 MAX_REDIRECTS = 10
 
-SENSITIVE_HEADERS = {"authorization", "cookie", "set-cookie", "x-api-key"}
+ROBOTS_CACHE_TTL = 6 * 60 * 60  # seconds; parsed robots.txt reused per site root
+ROBOTS_VERDICT_CACHE_SIZE = 4096  # per-RobotsRules memo of path -> verdict
+_ROBOTS_CACHE: dict[str, tuple["RobotsRules", float]] = {}
+
+SENSITIVE_HEADERS = frozenset({"authorization", "cookie", "set-cookie", "x-api-key"})
 PRIVATE_IP_RANGES = [
     ipaddress.ip_network("10.0.0.0/8"),
     ipaddress.ip_network("172.16.0.0/12"),
@@ -30,15 +44,10 @@ def ignore_robots() -> bool:
 
 
 def redact_headers(headers: Mapping[str, Any]) -> dict[str, str]:
-    redacted: dict[str, str] = {}
-    for key, value in (headers or {}).items():
-        key_str = str(key)
-        lower = key_str.lower()
-        if lower in SENSITIVE_HEADERS:
-            redacted[key_str] = "[REDACTED]"
-        else:
-            redacted[key_str] = str(value)
-    return redacted
+    return {
+        str(key): ("[REDACTED]" if str(key).lower() in SENSITIVE_HEADERS else str(value))
+        for key, value in (headers or {}).items()
+    }
 
 
 def validate_url(url: str) -> None:
@@ -70,7 +79,18 @@ def validate_url(url: str) -> None:
         raise ValueError(f"DNS resolution failed for {parsed.hostname}")
 
 
-def read_limited_text(resp: Any, max_bytes: int | None) -> tuple[str, bool]:
+def parse_xml(body: str | bytes):
+    """Parse an XML document (e.g. a sitemap) with the DTD/entity guards above."""
+    return _ET.fromstring(body, **SAFE_XML_KWARGS)
+
+
+def read_limited_text(
+    resp: Any, max_bytes: int | None, on_chunk: Callable[[bytes], None] | None = None
+) -> tuple[str, bool]:
+    """Read a streamed body up to `max_bytes`; returns (text, too_large).
+
+    `on_chunk` sees each raw chunk as it arrives (e.g. TechDetector.feed).
+    """
     if max_bytes is not None:
         content_length = resp.headers.get("Content-Length")
         try:
@@ -84,6 +104,8 @@ def read_limited_text(resp: Any, max_bytes: int | None) -> tuple[str, bool]:
         if not chunk:
             continue
         chunks.append(chunk)
+        if on_chunk is not None:
+            on_chunk(chunk)
         size += len(chunk)
         if max_bytes is not None and size > max_bytes:
             return "", True
@@ -95,9 +117,71 @@ def read_limited_text(resp: Any, max_bytes: int | None) -> tuple[str, bool]:
         return data.decode("utf-8", errors="replace"), False
 
 
-def parse_robots(text: str) -> dict[str, list[str]]:
-    ua_rules: dict[str, list[str]] = {}
+class RobotsRules(dict):
+    """User-agent -> Disallow rules, as returned by parse_robots().
+
+    Behaves like a plain dict; robots_disallows caches its compiled prefix
+    matcher and per-path verdicts on the instance, so treat the rules as
+    read-only once used.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._matcher: _RobotsMatcher | None = None
+        self._verdicts: dict[str, tuple[bool, str | None]] = {}
+
+
+# Marks "a rule ends here" inside a trie node; never collides with a path char.
+_RULE_END = ""
+
+
+class _RobotsMatcher:
+    """Prefix trie over Disallow rules.
+
+    Lookup walks the URL path once, so cost depends on path length rather
+    than on the number of rules. Each terminal stores the rule's position in
+    the original list so the first matching rule (in list order) is reported,
+    exactly as a linear scan would.
+    """
+
+    __slots__ = ("_rules", "_trie", "_catch_all")
+
+    def __init__(self, rules: list[str]) -> None:
+        self._rules: list[str] = []
+        self._trie: dict = {}
+        self._catch_all: int | None = None
+        for raw in rules:
+            rule = (raw or "").strip()
+            if not rule:
+                continue
+            idx = len(self._rules)
+            self._rules.append(rule)
+            if rule == "/" and self._catch_all is None:
+                self._catch_all = idx
+            if not rule.startswith("/"):
+                continue
+            node = self._trie
+            for ch in rule:
+                node = node.setdefault(ch, {})
+            node.setdefault(_RULE_END, idx)
+
+    def first_match(self, path: str) -> str | None:
+        best = self._catch_all
+        node = self._trie
+        for ch in path:
+            node = node.get(ch)
+            if node is None:
+                break
+            idx = node.get(_RULE_END)
+            if idx is not None and (best is None or idx < best):
+                best = idx
+        return None if best is None else self._rules[best]
+
+
+def parse_robots(text: str) -> RobotsRules:
+    ua_rules = RobotsRules()
     current_uas: list[str] = []
+    in_ua_group = False
     for raw in (text or "").splitlines():
         line = raw.strip()
         if not line:
@@ -109,9 +193,15 @@ def parse_robots(text: str) -> dict[str, list[str]]:
         lower = line.lower()
         if lower.startswith("user-agent:"):
             ua = line.split(":", 1)[1].strip().lower()
-            current_uas = [ua]
+            # RFC 9309: consecutive User-agent lines share one group of rules.
+            if in_ua_group:
+                current_uas.append(ua)
+            else:
+                current_uas = [ua]
+            in_ua_group = True
             ua_rules.setdefault(ua, [])
             continue
+        in_ua_group = False
         if lower.startswith("disallow:"):
             rule = line.split(":", 1)[1].strip()
             if not current_uas:
@@ -121,15 +211,41 @@ def parse_robots(text: str) -> dict[str, list[str]]:
     return ua_rules
 
 
+def _robots_matcher(ua_rules: dict[str, list[str]]) -> _RobotsMatcher:
+    matcher = getattr(ua_rules, "_matcher", None)
+    if matcher is None:
+        rules = (ua_rules.get("*", []) or []) + (ua_rules.get("scope", []) or [])
+        matcher = _RobotsMatcher(rules)
+        if isinstance(ua_rules, RobotsRules):
+            ua_rules._matcher = matcher
+    return matcher
+
+
 def robots_disallows(url: str, ua_rules: dict[str, list[str]]) -> tuple[bool, str | None]:
     path = urlparse(url).path or "/"
-    rules = (ua_rules.get("*", []) or []) + (ua_rules.get("scope", []) or [])
-    for rule in rules:
-        rule = (rule or "").strip()
-        if not rule:
-            continue
-        if rule == "/":
-            return True, rule
-        if rule.startswith("/") and path.startswith(rule):
-            return True, rule
-    return False, None
+    verdicts = getattr(ua_rules, "_verdicts", None)
+    if verdicts is not None:
+        cached = verdicts.get(path)
+        if cached is not None:
+            return cached
+    rule = _robots_matcher(ua_rules).first_match(path)
+    result = ((rule is not None), rule)
+    if verdicts is not None and len(verdicts) < ROBOTS_VERDICT_CACHE_SIZE:
+        verdicts[path] = result
+    return result
+
+
+def get_cached_robots(site_root: str) -> RobotsRules | None:
+    """Return rules parsed for site_root within the last ROBOTS_CACHE_TTL seconds."""
+    entry = _ROBOTS_CACHE.get(site_root)
+    if entry is None:
+        return None
+    rules, fetched_at = entry
+    if time.monotonic() - fetched_at >= ROBOTS_CACHE_TTL:
+        _ROBOTS_CACHE.pop(site_root, None)
+        return None
+    return rules
+
+
+def cache_robots(site_root: str, rules: RobotsRules) -> None:
+    _ROBOTS_CACHE[site_root] = (rules, time.monotonic())
@@ -1216,18 +1216,20 @@ def export_audit_pdf(audit_result: dict, out_path: str, tool_version: str = "unk
     # Locate assets
     base_dir = os.path.dirname(os.path.abspath(out_path))
     
-    def _find_asset(name):
-        cands = [
-            os.path.join(base_dir, "scope", name),
-            os.path.join(base_dir, "evidence", name),
-            os.path.join(base_dir, name),
-        ]
-        for c in cands:
-             if os.path.exists(c): return c
+    def _find_asset(*names):
+        for name in names:
+            cands = [
+                os.path.join(base_dir, "scope", name),
+                os.path.join(base_dir, "evidence", name),
+                os.path.join(base_dir, name),
+            ]
+            for c in cands:
+                 if os.path.exists(c): return c
         return None
 
-    desktop_img_path = _find_asset("home.png")
-    mobile_img_path = _find_asset("home_mobile.png")
+    # Batch captures write JPEG; crawl evidence and older runs have PNG.
+    desktop_img_path = _find_asset("home.jpg", "home.png")
+    mobile_img_path = _find_asset("home_mobile.jpg", "home_mobile.png")
     perf_path = _find_asset("performance.json")
 
     # Load Metrics
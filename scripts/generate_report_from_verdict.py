@@ -2,29 +2,30 @@
 """Generate Decision Brief and Evidence Appendix from verdict.json.
 
 Usage:
-    python3 generate_report_from_verdict.py <RUN_DIR> [--lang RO|EN]
+    python3 generate_report_from_verdict.py <RUN_DIR> [--lang RO|EN] [--backend full|stub] [--force]
 """
 from __future__ import annotations
 
 import argparse
+import hashlib
+import html
 import json
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import LETTER
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import (
-    SimpleDocTemplate,
-    Paragraph,
-    Spacer,
-    Table,
-    TableStyle,
-    PageBreak,
-    ListFlowable,
-    ListItem,
-)
+try:
+    import ijson
+except ImportError:
+    ijson = None  # Optional: stream pages.json instead of loading it whole
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "lib"))
+from _process_pool import run_in_processes  # noqa: E402
+
+# ReportLab is imported inside the builders: it is slow to import and not
+# needed for --help, cached runs, or the PDFium stub path.
+LETTER = (612.0, 792.0)  # reportlab.lib.pagesizes.LETTER, in points
 
 
 def _load_verdict(run_dir: Path) -> tuple[Path, dict]:
@@ -35,6 +36,8 @@ def _load_verdict(run_dir: Path) -> tuple[Path, dict]:
         run_dir / "astra" / "verdict.json",
         run_dir / "astra" / "audit" / "verdict.json",
     ]
+    # Sequential probe: five local stats are cheaper than spinning up threads,
+    # and the first hit usually short-circuits the rest.
     for path in candidates:
         if path.is_file():
             try:
@@ -58,6 +61,30 @@ def _safe_text(value, fallback: str = "") -> str:
     return text if text else fallback
 
 
+def _get_dict(data: dict, key: str) -> dict:
+    value = data.get(key)
+    return value if isinstance(value, dict) else {}
+
+
+def _get_list(data: dict, key: str) -> list:
+    value = data.get(key)
+    return value if isinstance(value, list) else []
+
+
+def _iter_page_urls(pages_path: Path):
+    """Yield the "url" field of every page object in pages.json."""
+    if ijson is not None:
+        # Stream only the url fields; pages.json may carry large HTML/screenshot blobs.
+        with pages_path.open("rb") as f:
+            yield from ijson.items(f, "item.url")
+        return
+    pages = json.loads(pages_path.read_text(encoding="utf-8"))
+    if isinstance(pages, list):
+        for page in pages:
+            if isinstance(page, dict):
+                yield page.get("url")
+
+
 def _collect_urls(data: dict, run_dir: Path) -> list[str]:
     urls: list[str] = []
     for key in ("url_input", "final_url"):
@@ -86,13 +113,8 @@ def _collect_urls(data: dict, run_dir: Path) -> list[str]:
 
     if pages_path:
         try:
-            pages = json.loads(pages_path.read_text(encoding="utf-8"))
-            if isinstance(pages, list):
-                for page in pages:
-                    if isinstance(page, dict):
-                        url = _safe_text(page.get("url"))
-                        if url:
-                            urls.append(url)
+            page_urls = [url for url in (_safe_text(u) for u in _iter_page_urls(pages_path)) if url]
+            urls.extend(page_urls)
         except Exception:
             pass
 
@@ -106,7 +128,10 @@ def _collect_urls(data: dict, run_dir: Path) -> list[str]:
     return unique
 
 
+@lru_cache(maxsize=16)
 def _verdict_badge_color(verdict: str):
+    from reportlab.lib import colors
+
     verdict = verdict.upper()
     return {
         "OK": colors.green,
@@ -119,19 +144,23 @@ def _verdict_badge_color(verdict: str):
     }.get(verdict, colors.gray)
 
 
+_IMPACT_RULES: tuple[tuple[tuple[str, ...], str], ...] = (
+    (("tracking", "observability", "analytics"), "Impact: tracking/attribution may be incomplete."),
+    (("conversion",), "Impact: paid traffic may not convert as expected."),
+    (("reachability", "landing"), "Impact: paid traffic may not reach a valid landing."),
+    (("index",), "Impact: visibility/indexability may be limited."),
+    (("trust", "security"), "Impact: trust signals may be weakened."),
+)
+_IMPACT_DEFAULT = "Impact: requires verification before ads."
+
+
+@lru_cache(maxsize=256)
 def _impact_for_category(name: str) -> str:
     n = name.lower()
-    if "tracking" in n or "observability" in n or "analytics" in n:
-        return "Impact: tracking/attribution may be incomplete."
-    if "conversion" in n:
-        return "Impact: paid traffic may not convert as expected."
-    if "reachability" in n or "landing" in n:
-        return "Impact: paid traffic may not reach a valid landing."
-    if "index" in n:
-        return "Impact: visibility/indexability may be limited."
-    if "trust" in n or "security" in n:
-        return "Impact: trust signals may be weakened."
-    return "Impact: requires verification before ads."
+    for keywords, impact in _IMPACT_RULES:
+        if any(k in n for k in keywords):
+            return impact
+    return _IMPACT_DEFAULT
 
 
 def _category_evidence_ref(cat: dict) -> str:
@@ -160,6 +189,18 @@ def _flatten_evidence(categories: dict) -> list[str]:
 
 
 def _build_decision_brief(out_path: Path, data: dict, lang: str, urls: list[str]) -> None:
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import (
+        ListFlowable,
+        ListItem,
+        PageBreak,
+        Paragraph,
+        SimpleDocTemplate,
+        Spacer,
+        Table,
+    )
+
     styles = getSampleStyleSheet()
     story = []
 
@@ -171,8 +212,7 @@ def _build_decision_brief(out_path: Path, data: dict, lang: str, urls: list[str]
     # Cover page
     story.append(Paragraph(f"{brand} Decision Brief", styles["Title"]))
     if domain:
-        story.append(Spacer(1, 8))
-        story.append(Paragraph(f"Domain: {domain}", styles["Heading3"]))
+        story.extend([Spacer(1, 8), Paragraph(f"Domain: {domain}", styles["Heading3"])])
     if timestamp:
         story.append(Paragraph(f"Date (UTC): {timestamp}", styles["BodyText"]))
 
@@ -187,35 +227,41 @@ def _build_decision_brief(out_path: Path, data: dict, lang: str, urls: list[str]
             ("INNERPADDING", (0, 0), (-1, -1), 8),
         ],
     )
-    story.append(Spacer(1, 12))
-    story.append(badge)
-    story.append(PageBreak())
+    story.extend([Spacer(1, 12), badge, PageBreak()])
 
-    categories = data.get("categories") if isinstance(data.get("categories"), dict) else {}
-    blockers = data.get("blockers") if isinstance(data.get("blockers"), list) else []
+    categories = _get_dict(data, "categories")
+    blockers = _get_list(data, "blockers")
+    sorted_names = sorted(categories)
 
     # Executive summary
-    story.append(Paragraph("Executive Summary" if lang == "EN" else "Sumar Executiv", styles["Heading1"]))
     total = len(categories)
-    non_pass = [name for name, cat in categories.items() if str((cat or {}).get("status", "")).upper() not in ("PASS", "OK")]
+    # Derived from sorted_names, so non_pass is already in display order.
+    non_pass = [
+        name
+        for name in sorted_names
+        if str((categories[name] or {}).get("status", "")).upper() not in ("PASS", "OK")
+    ]
     parts = [f"Verdict: {verdict}."]
     if total:
         parts.append(f"Categories evaluated: {total}.")
     if non_pass:
-        parts.append(f"Requires attention: {', '.join(sorted(non_pass))}.")
+        parts.append(f"Requires attention: {', '.join(non_pass)}.")
     if blockers:
         parts.append(f"Blockers listed: {len(blockers)}.")
     summary = " ".join(parts)
-    story.append(Paragraph(summary, styles["BodyText"]))
-    story.append(Spacer(1, 10))
+    story.extend([
+        Paragraph("Executive Summary" if lang == "EN" else "Sumar Executiv", styles["Heading1"]),
+        Paragraph(summary, styles["BodyText"]),
+        Spacer(1, 10),
+    ])
 
     # Top risks
-    story.append(Paragraph("Top Risks" if lang == "EN" else "Riscuri Majore", styles["Heading1"]))
     risks: list[str] = []
     if blockers:
         for item in blockers:
             risks.append(f"{item} — Impact: blocks approval until resolved. Evidence: verdict.json")
-    for name in sorted(non_pass):
+    # Only the first five risks are shown.
+    for name in non_pass[:max(0, 5 - len(risks))]:
         cat = categories.get(name) or {}
         impact = _impact_for_category(name)
         ref = _category_evidence_ref(cat)
@@ -223,16 +269,18 @@ def _build_decision_brief(out_path: Path, data: dict, lang: str, urls: list[str]
     if not risks:
         risks.append("No risks listed in verdict.json.")
     risks = risks[:5]
-    story.append(ListFlowable([ListItem(Paragraph(r, styles["BodyText"])) for r in risks], bulletType="bullet"))
-    story.append(Spacer(1, 10))
+    story.extend([
+        Paragraph("Top Risks" if lang == "EN" else "Riscuri Majore", styles["Heading1"]),
+        ListFlowable([ListItem(Paragraph(r, styles["BodyText"])) for r in risks], bulletType="bullet"),
+        Spacer(1, 10),
+    ])
 
     # Required actions
-    story.append(Paragraph("Required Actions Before Ads" if lang == "EN" else "Actiuni Necesare Inainte de Ads", styles["Heading1"]))
     actions: list[str] = []
     if blockers:
         actions = [str(b) for b in blockers]
     elif non_pass:
-        for name in sorted(non_pass):
+        for name in non_pass:
             cat = categories.get(name) or {}
             reasons = cat.get("reasons") if isinstance(cat, dict) else None
             if isinstance(reasons, list) and reasons:
@@ -241,112 +289,405 @@ def _build_decision_brief(out_path: Path, data: dict, lang: str, urls: list[str]
                 actions.append(f"{name}: review required")
     if not actions:
         actions.append("No required actions listed in verdict.json.")
-    story.append(ListFlowable([ListItem(Paragraph(a, styles["BodyText"])) for a in actions], bulletType="bullet"))
-    story.append(Spacer(1, 10))
+    story.extend([
+        Paragraph("Required Actions Before Ads" if lang == "EN" else "Actiuni Necesare Inainte de Ads", styles["Heading1"]),
+        ListFlowable([ListItem(Paragraph(a, styles["BodyText"])) for a in actions], bulletType="bullet"),
+        Spacer(1, 10),
+    ])
 
     # Scope & limitations
-    story.append(Paragraph("Scope & Limitations" if lang == "EN" else "Arie si Limitari", styles["Heading1"]))
-    audited = ", ".join(sorted(categories.keys())) if categories else "No categories provided"
-    story.append(Paragraph(f"Audited categories: {audited}.", styles["BodyText"]))
+    audited = ", ".join(sorted_names) if categories else "No categories provided"
     not_audited = [
         "Creative quality",
         "Legal compliance",
         "Backend data integrity",
         "Load testing or performance under sustained traffic",
     ]
-    story.append(Paragraph("Not audited by this toolset:", styles["BodyText"]))
-    story.append(ListFlowable([ListItem(Paragraph(x, styles["BodyText"])) for x in not_audited], bulletType="bullet"))
+    story.extend([
+        Paragraph("Scope & Limitations" if lang == "EN" else "Arie si Limitari", styles["Heading1"]),
+        Paragraph(f"Audited categories: {audited}.", styles["BodyText"]),
+        Paragraph("Not audited by this toolset:", styles["BodyText"]),
+        ListFlowable([ListItem(Paragraph(x, styles["BodyText"])) for x in not_audited], bulletType="bullet"),
+    ])
 
     doc = SimpleDocTemplate(str(out_path), pagesize=LETTER, title="Decision Brief")
     doc.build(story)
 
 
+class _AppendixCanvas:
+    """Single-pass canvas writer with a y-cursor; no Platypus layout."""
+
+    MARGIN = 72
+
+    def __init__(self, out_path: Path) -> None:
+        from reportlab.lib.utils import simpleSplit
+        from reportlab.pdfgen import canvas
+
+        self._split = simpleSplit
+        self.canvas = canvas.Canvas(str(out_path), pagesize=LETTER)
+        self.canvas.setTitle("Evidence Appendix")
+        self.width, self.height = LETTER
+        self.y = self.height - self.MARGIN
+
+    def page_break(self) -> None:
+        self.canvas.showPage()
+        self.y = self.height - self.MARGIN
+
+    def text(self, value: str, font: str, size: float, *, bullet: bool = False, space_before: float = 0) -> None:
+        leading = size * 1.2
+        indent = 18 if bullet else 0
+        max_width = self.width - (2 * self.MARGIN) - indent
+        lines = self._split(value, font, size, max_width) or [""]
+        if self.y - space_before - leading < self.MARGIN:
+            self.page_break()
+        elif self.y < self.height - self.MARGIN:
+            self.y -= space_before
+        text_obj = self.canvas.beginText()
+        text_obj.setFont(font, size, leading)
+        for idx, line in enumerate(lines):
+            if self.y - leading < self.MARGIN:
+                self.canvas.drawText(text_obj)
+                self.page_break()
+                text_obj = self.canvas.beginText()
+                text_obj.setFont(font, size, leading)
+            self.y -= leading
+            if bullet and idx == 0:
+                self.canvas.drawString(self.MARGIN + 6, self.y, "\u2022")
+            text_obj.setTextOrigin(self.MARGIN + indent, self.y)
+            text_obj.textOut(line)
+        self.canvas.drawText(text_obj)
+
+    def title(self, value: str) -> None:
+        self.text(value, "Helvetica-Bold", 18)
+
+    def heading1(self, value: str) -> None:
+        self.text(value, "Helvetica-Bold", 14, space_before=12)
+
+    def heading3(self, value: str) -> None:
+        self.text(value, "Helvetica-Bold", 11, space_before=8)
+
+    def body(self, value: str) -> None:
+        self.text(value, "Helvetica", 10, space_before=4)
+
+    def bullets(self, items: list[str]) -> None:
+        for item in items:
+            self.text(item, "Helvetica", 10, bullet=True, space_before=4)
+
+    def save(self) -> None:
+        self.canvas.showPage()
+        self.canvas.save()
+
+
+APPENDIX_TOOL_SECTIONS = (
+    "Audit Evidence",
+    "Action Scope Evidence",
+    "Proof Pack Evidence",
+    "Regression Evidence",
+)
+
+
+def _appendix_sections(data: dict) -> list[tuple[str, list[str]]]:
+    """Return (title, evidence lines) for each tool section of the appendix."""
+    categories = _get_dict(data, "categories")
+    evidence_summary = _get_dict(data, "evidence_summary")
+    signals = _get_dict(data, "signals")
+
+    def detail_lines_for(relevant_categories: list[str]) -> list[str]:
+        # Response codes / headers
+        detail_lines: list[str] = []
+        detail_lines.extend(
+            f"{key}: {text}"
+            for key, val in sorted(evidence_summary.items())
+            if val is not None and (text := str(val).strip())
+        )
+        for name in relevant_categories:
+            cat = categories.get(name) or {}
+            ev = cat.get("evidence") if isinstance(cat, dict) else None
+            if isinstance(ev, dict):
+                detail_lines.extend(
+                    f"{name}: {key} = {text}"
+                    for key, val in sorted(ev.items())
+                    if val is not None and (text := str(val).strip())
+                )
+        detail_lines.extend(
+            f"signal.{key}: {text}"
+            for key, val in sorted(signals.items())
+            if val is not None and (text := str(val).strip())
+        )
+        return detail_lines
+
+    # Determine categories by tool
+    names = list(categories.keys())
+    audit_cats = [n for n in names if any(k in n.lower() for k in ["reachability", "landing", "conversion", "tracking", "index"])]
+    action_cats = [n for n in names if any(k in n.lower() for k in ["conversion", "landing", "reachability"])]
+    proof_cats = [n for n in names if any(k in n.lower() for k in ["tracking", "observability", "analytics"])]
+    regression_cats = [n for n in names if "regression" in n.lower()]
+
+    per_tool = (audit_cats, action_cats, proof_cats, regression_cats)
+    return [
+        (title, detail_lines_for(cats or names))
+        for title, cats in zip(APPENDIX_TOOL_SECTIONS, per_tool)
+    ]
+
+
 def _build_evidence_appendix(out_path: Path, data: dict, lang: str, urls: list[str]) -> None:
-    styles = getSampleStyleSheet()
-    story = []
+    pdf = _AppendixCanvas(out_path)
 
     brand = _safe_text(data.get("brand"), "SCOPE")
     domain = _safe_text(data.get("final_url") or data.get("url_input"))
     timestamp = _safe_text(data.get("timestamp_utc"))
 
-    story.append(Paragraph(f"{brand} Evidence Appendix", styles["Title"]))
+    pdf.title(f"{brand} Evidence Appendix")
     if domain:
-        story.append(Paragraph(f"Domain: {domain}", styles["Heading3"]))
+        pdf.heading3(f"Domain: {domain}")
     if timestamp:
-        story.append(Paragraph(f"Date (UTC): {timestamp}", styles["BodyText"]))
-    story.append(PageBreak())
+        pdf.body(f"Date (UTC): {timestamp}")
+    pdf.page_break()
 
     # TOC (simple list)
-    story.append(Paragraph("Table of Contents" if lang == "EN" else "Cuprins", styles["Heading1"]))
-    toc_items = [
-        "Audit Evidence",
-        "Action Scope Evidence",
-        "Proof Pack Evidence",
-        "Regression Evidence",
-    ]
-    story.append(ListFlowable([ListItem(Paragraph(item, styles["BodyText"])) for item in toc_items], bulletType="bullet"))
-    story.append(PageBreak())
-
-    categories = data.get("categories") if isinstance(data.get("categories"), dict) else {}
-    evidence_summary = data.get("evidence_summary") if isinstance(data.get("evidence_summary"), dict) else {}
-    signals = data.get("signals") if isinstance(data.get("signals"), dict) else {}
+    pdf.heading1("Table of Contents" if lang == "EN" else "Cuprins")
+    pdf.bullets(list(APPENDIX_TOOL_SECTIONS))
 
-    def add_tool_section(title: str, relevant_categories: list[str]) -> None:
-        story.append(Paragraph(title, styles["Heading1"]))
+    for title, detail_lines in _appendix_sections(data):
+        pdf.page_break()
+        pdf.heading1(title)
         # URLs tested
         if urls:
-            story.append(Paragraph("URLs tested:", styles["Heading3"]))
-            story.append(ListFlowable([ListItem(Paragraph(u, styles["BodyText"])) for u in urls], bulletType="bullet"))
+            pdf.heading3("URLs tested:")
+            pdf.bullets(urls)
+        if detail_lines:
+            pdf.heading3("Evidence detected:")
+            pdf.bullets(detail_lines)
+        else:
+            pdf.body("No evidence items recorded for this tool.")
+
+    pdf.save()
+
+
+# WeasyPrint renders long tables quadratically; keep each <table> bounded.
+HTML_TABLE_MAX_ROWS = 500
+
+_APPENDIX_HTML = """<!DOCTYPE html>
+<html lang="{lang}">
+<head>
+<meta charset="utf-8">
+<title>Evidence Appendix</title>
+<style>
+  @page {{ size: letter; margin: 1in; }}
+  body {{ font-family: Helvetica, Arial, sans-serif; font-size: 10pt; }}
+  h1 {{ font-size: 14pt; }}
+  h3 {{ font-size: 11pt; }}
+  section {{ page-break-before: always; }}
+  table {{ width: 100%; border-collapse: collapse; }}
+  td {{ border-bottom: 0.5pt solid #d1d5db; padding: 2pt 4pt; word-break: break-all; }}
+</style>
+</head>
+<body>
+<h1 class="title">{title}</h1>
+{meta}
+<section>
+<h1>{toc_title}</h1>
+<ul>{toc}</ul>
+</section>
+{sections}
+</body>
+</html>
+"""
 
-        # Response codes / headers
-        detail_lines: list[str] = []
-        if evidence_summary:
-            for key in sorted(evidence_summary.keys()):
-                val = _safe_text(evidence_summary.get(key))
-                if val:
-                    detail_lines.append(f"{key}: {val}")
-        for name in relevant_categories:
-            cat = categories.get(name) or {}
-            ev = cat.get("evidence") if isinstance(cat, dict) else None
-            if isinstance(ev, dict):
-                for key in sorted(ev.keys()):
-                    val = _safe_text(ev.get(key))
-                    if val:
-                        detail_lines.append(f"{name}: {key} = {val}")
-        if signals:
-            for key in sorted(signals.keys()):
-                val = _safe_text(signals.get(key))
-                if val:
-                    detail_lines.append(f"signal.{key}: {val}")
 
+def _html_tables(rows: list[str]) -> str:
+    chunks = []
+    for offset in range(0, len(rows), HTML_TABLE_MAX_ROWS):
+        body = "".join(f"<tr><td>{html.escape(row)}</td></tr>" for row in rows[offset:offset + HTML_TABLE_MAX_ROWS])
+        chunks.append(f"<table>{body}</table>")
+    return "\n".join(chunks)
+
+
+def _render_evidence_appendix_html(data: dict, lang: str, urls: list[str]) -> str:
+    brand = _safe_text(data.get("brand"), "SCOPE")
+    domain = _safe_text(data.get("final_url") or data.get("url_input"))
+    timestamp = _safe_text(data.get("timestamp_utc"))
+
+    meta = []
+    if domain:
+        meta.append(f"<h3>Domain: {html.escape(domain)}</h3>")
+    if timestamp:
+        meta.append(f"<p>Date (UTC): {html.escape(timestamp)}</p>")
+
+    sections = []
+    for title, detail_lines in _appendix_sections(data):
+        parts = [f"<h1>{html.escape(title)}</h1>"]
+        if urls:
+            parts.append("<h3>URLs tested:</h3>")
+            parts.append(_html_tables(urls))
         if detail_lines:
-            story.append(Paragraph("Evidence detected:", styles["Heading3"]))
-            story.append(ListFlowable([ListItem(Paragraph(line, styles["BodyText"])) for line in detail_lines], bulletType="bullet"))
+            parts.append("<h3>Evidence detected:</h3>")
+            parts.append(_html_tables(detail_lines))
         else:
-            story.append(Paragraph("No evidence items recorded for this tool.", styles["BodyText"]))
+            parts.append("<p>No evidence items recorded for this tool.</p>")
+        sections.append("<section>" + "\n".join(parts) + "</section>")
+
+    return _APPENDIX_HTML.format(
+        lang=lang.lower(),
+        title=html.escape(f"{brand} Evidence Appendix"),
+        meta="\n".join(meta),
+        toc_title="Table of Contents" if lang == "EN" else "Cuprins",
+        toc="".join(f"<li>{html.escape(item)}</li>" for item in APPENDIX_TOOL_SECTIONS),
+        sections="\n".join(sections),
+    )
 
-        story.append(PageBreak())
 
-    # Determine categories by tool
-    names = list(categories.keys())
-    audit_cats = [n for n in names if any(k in n.lower() for k in ["reachability", "landing", "conversion", "tracking", "index"])]
-    action_cats = [n for n in names if any(k in n.lower() for k in ["conversion", "landing", "reachability"])]
-    proof_cats = [n for n in names if any(k in n.lower() for k in ["tracking", "observability", "analytics"])]
-    regression_cats = [n for n in names if "regression" in n.lower()]
+def _build_evidence_appendix_weasyprint(out_path: Path, data: dict, lang: str, urls: list[str]) -> None:
+    from weasyprint import HTML
 
-    add_tool_section("Audit Evidence", audit_cats or names)
-    add_tool_section("Action Scope Evidence", action_cats or names)
-    add_tool_section("Proof Pack Evidence", proof_cats or names)
-    add_tool_section("Regression Evidence", regression_cats or names)
+    HTML(string=_render_evidence_appendix_html(data, lang, urls)).write_pdf(str(out_path))
+
+
+APPENDIX_ENGINES = {
+    "reportlab": _build_evidence_appendix,
+    "weasyprint": _build_evidence_appendix_weasyprint,
+}
 
-    doc = SimpleDocTemplate(str(out_path), pagesize=LETTER, title="Evidence Appendix")
-    doc.build(story)
+
+def _write_stub_pdf_pdfium(out_path: Path, title: str, lines: list[str]) -> None:
+    import ctypes
+
+    import pypdfium2 as pdfium
+    import pypdfium2.raw as pdfium_c
+
+    pdf = pdfium.PdfDocument.new()
+    width, height = LETTER
+    page = pdf.new_page(width, height)
+    fonts = {
+        name: pdfium_c.FPDFText_LoadStandardFont(pdf, name)
+        for name in (b"Helvetica-Bold", b"Helvetica")
+    }
+    rows = [(title, b"Helvetica-Bold", 18)] + [(line, b"Helvetica", 11) for line in lines]
+    y = height - 72
+    for idx, (text, font_name, size) in enumerate(rows):
+        if idx:
+            y -= 18
+        obj = pdfium_c.FPDFPageObj_CreateTextObj(pdf, fonts[font_name], size)
+        wide = ctypes.create_string_buffer((text + "\x00").encode("utf-16-le"))
+        pdfium_c.FPDFText_SetText(obj, ctypes.cast(wide, ctypes.POINTER(pdfium_c.FPDF_WCHAR)))
+        pdfium_c.FPDFPageObj_Transform(obj, 1, 0, 0, 1, 72, y)
+        pdfium_c.FPDFPage_InsertObject(page, obj)
+    pdfium_c.FPDFPage_GenerateContent(page)
+    for font in fonts.values():
+        pdfium_c.FPDFFont_Close(font)
+    pdf.save(str(out_path))
+
+
+def _is_winansi(*texts: str) -> bool:
+    try:
+        for text in texts:
+            text.encode("cp1252")
+    except UnicodeEncodeError:
+        return False
+    return True
+
+
+def _write_stub_pdf(out_path: Path, title: str, lines: list[str]) -> None:
+    # Prefer the native PDFium writer for the fixed-layout stub; it skips
+    # ReportLab's pure-Python font metrics and content stream assembly.
+    # PDFium sets no /Title, and its standard fonts only encode WinAnsi, so
+    # other text (e.g. RO diacritics) stays on the ReportLab canvas.
+    if _is_winansi(title, *lines):
+        try:
+            _write_stub_pdf_pdfium(out_path, title, lines)
+            return
+        except ImportError:
+            # pypdfium2 not installed; use the ReportLab canvas.
+            pass
+    from reportlab.pdfgen import canvas
+
+    c = canvas.Canvas(str(out_path), pagesize=LETTER)
+    c.setTitle(title)
+    _, height = LETTER
+    y = height - 72
+    c.setFont("Helvetica-Bold", 18)
+    c.drawString(72, y, title)
+    c.setFont("Helvetica", 11)
+    for line in lines:
+        y -= 18
+        c.drawString(72, y, line)
+    c.showPage()
+    c.save()
+
+
+def _stub_lines(data: dict) -> list[str]:
+    lines = [
+        f"Verdict: {_safe_text(data.get('verdict'), 'UNKNOWN')}",
+        f"Domain: {_safe_text(data.get('final_url') or data.get('url_input'), '(unknown)')}",
+    ]
+    timestamp = _safe_text(data.get("timestamp_utc"))
+    if timestamp:
+        lines.append(f"Date (UTC): {timestamp}")
+    lines.append("Full report rendering skipped; see deliverables/verdict.json.")
+    return lines
+
+
+def _run_builder(builder, out_path: Path, data: dict, lang: str, urls: list[str]) -> None:
+    builder(out_path, data, lang, urls)
+
+
+def _build_full_deliverables(brief_path: Path, appendix_path: Path, data: dict, lang: str, urls: list[str], build_appendix) -> None:
+    # The two PDFs share no state; build them in separate processes.
+    run_in_processes(
+        _run_builder,
+        [
+            (_build_decision_brief, brief_path, data, lang, urls),
+            (build_appendix, appendix_path, data, lang, urls),
+        ],
+        max_workers=2,
+    )
+
+
+def _build_stub_deliverables(brief_path: Path, appendix_path: Path, data: dict, lang: str, urls: list[str], build_appendix) -> None:
+    brand = _safe_text(data.get("brand"), "SCOPE")
+    lines = _stub_lines(data)
+    _write_stub_pdf(brief_path, f"{brand} Decision Brief", lines)
+    _write_stub_pdf(appendix_path, f"{brand} Evidence Appendix", lines)
+
+
+DELIVERABLE_BACKENDS = {
+    "full": _build_full_deliverables,
+    "stub": _build_stub_deliverables,
+}
+
+# Sidecar in deliverables/ recording what the current PDFs were built from.
+DIGEST_FILENAME = ".verdict.hash"
+
+
+def _deliverables_digest(data: dict, lang: str, urls: list[str], backend: str, engine: str) -> str:
+    payload = json.dumps(
+        {"verdict": data, "lang": lang, "urls": urls, "backend": backend, "engine": engine},
+        sort_keys=True,
+    ).encode("utf-8")
+    h = hashlib.blake2b(digest_size=16)
+    # Include this script so generator changes invalidate cached PDFs.
+    h.update(Path(__file__).read_bytes())
+    h.update(payload)
+    return h.hexdigest()
 
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="Generate Decision Brief and Evidence Appendix from verdict.json")
     parser.add_argument("run_dir", help="Path to the run directory containing verdict.json")
     parser.add_argument("--lang", default=None, help="Language (RO or EN)")
+    parser.add_argument(
+        "--backend",
+        choices=sorted(DELIVERABLE_BACKENDS),
+        default="full",
+        help="full renders both reports; stub writes one-page placeholder PDFs",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=sorted(APPENDIX_ENGINES),
+        default="reportlab",
+        help="Evidence Appendix renderer (weasyprint requires the optional weasyprint package)",
+    )
+    parser.add_argument("--force", action="store_true", help="Rebuild PDFs even if verdict.json is unchanged")
     args = parser.parse_args()
 
     run_dir = Path(args.run_dir).resolve()
@@ -360,6 +701,14 @@ def main() -> int:
         print("ERROR: verdict.json missing")
         return 2
 
+    build_appendix = APPENDIX_ENGINES[args.engine]
+    if args.backend == "full" and args.engine == "weasyprint":
+        try:
+            import weasyprint  # noqa: F401
+        except ImportError:
+            print("ERROR: weasyprint not installed")
+            return 2
+
     lang = _detect_lang(data, args.lang)
     urls = _collect_urls(data, run_dir)
 
@@ -379,8 +728,21 @@ def main() -> int:
     brief_path = deliverables_dir / f"Decision_Brief_{lang}.pdf"
     appendix_path = deliverables_dir / f"Evidence_Appendix_{lang}.pdf"
 
-    _build_decision_brief(brief_path, data, lang, urls)
-    _build_evidence_appendix(appendix_path, data, lang, urls)
+    digest = _deliverables_digest(data, lang, urls, args.backend, args.engine)
+    digest_path = deliverables_dir / DIGEST_FILENAME
+    if not args.force and brief_path.is_file() and appendix_path.is_file():
+        try:
+            cached = digest_path.read_text(encoding="utf-8").strip()
+        except OSError:
+            cached = ""
+        if cached == digest:
+            print("OK deliverables (cached)")
+            return 0
+
+    # Drop the old digest first so a failed build can never look cached.
+    digest_path.unlink(missing_ok=True)
+    DELIVERABLE_BACKENDS[args.backend](brief_path, appendix_path, data, lang, urls, build_appendix)
+    digest_path.write_text(digest + "\n", encoding="utf-8")
 
     print("OK deliverables")
     return 0
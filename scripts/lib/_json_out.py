@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional: faster encoder, same bytes as the json fallback
+
+
+def json_bytes(obj: Any, indent: bool = False) -> bytes:
+    """
+    obj as sorted-key JSON plus a trailing newline, byte-identical to
+    json.dump(obj, sort_keys=True, ...) with its default ensure_ascii=True.
+    """
+    if orjson is not None:
+        option = orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        payload = orjson.dumps(obj, option=option)
+        # orjson writes non-ASCII as raw UTF-8 where json escapes it; only
+        # all-ASCII output is guaranteed to match.
+        if payload.isascii():
+            return payload
+    if indent:
+        text = json.dumps(obj, sort_keys=True, indent=2)
+    else:
+        text = json.dumps(obj, sort_keys=True, separators=(",", ":"))
+    return (text + "\n").encode("ascii")
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterable
+
+
+def run_in_processes(fn: Callable[..., Any], jobs: Iterable[tuple], **pool_kwargs: Any) -> list:
+    """
+    Run fn(*job) for every job in a process pool; results come back in job order.
+
+    Jobs run in-process only when the pool cannot be started (no process
+    support on this host). Errors raised by fn propagate as they are, and so
+    does BrokenProcessPool (a worker or its initializer died): a sequential
+    rerun would only fail the same way.
+    """
+    jobs = list(jobs)
+    if len(jobs) < 2:
+        return [fn(*job) for job in jobs]
+    pool = None
+    try:
+        pool = ProcessPoolExecutor(**pool_kwargs)
+        futures = [pool.submit(fn, *job) for job in jobs]
+    except (OSError, NotImplementedError):
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        return [fn(*job) for job in jobs]
+    with pool:
+        return [future.result() for future in futures]
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+import time
+
+
+def utc_now_iso() -> str:
+    """
+    Same string as datetime.now(timezone.utc).isoformat(), without building
+    datetime objects: the fraction is dropped when microseconds are 0.
+    """
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    stamp = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+    micros = ns // 1000
+    return f"{stamp}.{micros:06d}+00:00" if micros else f"{stamp}+00:00"
@@ -1,15 +1,59 @@
 import datetime as dt
+import functools
+import io
 import os
 import re
+import time
 import unicodedata
+from types import MappingProxyType
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import mm
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfgen import canvas
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 
+from _process_pool import run_in_processes
+
+# Design tokens
+_GREY_50 = colors.HexColor("#f9fafb")
+_GREY_200 = colors.HexColor("#e5e7eb")
+_GREY_300 = colors.HexColor("#d1d5db")
+_GREY_500 = colors.HexColor("#6b7280")
+_GREY_900 = colors.HexColor("#111827")
+
+# Page geometry (A4, points). The brief is a fixed single page drawn straight
+# onto the canvas; only text that can wrap goes through Paragraph.
+_PAGE_W, _PAGE_H = A4
+_LMARGIN = _RMARGIN = 18 * mm
+_TMARGIN = _BMARGIN = 16 * mm
+_INSET = 6  # inner padding of a Platypus frame / table cell, kept for layout
+_CONTENT_W = _PAGE_W - _LMARGIN - _RMARGIN - 2 * _INSET
+_HEADER_COLS = (120 * mm, 40 * mm)
+_META_LABEL_W = 30 * mm
+_META_VALUE_W = 130 * mm
+_STATUS_W = 70 * mm
+_STATUS_PAD_X, _STATUS_PAD_Y = 8, 6
+_FOOTER_COLS = (55 * mm, 45 * mm, 55 * mm)
+_H2_SIZE, _H2_LEADING, _H2_BEFORE, _H2_AFTER = 12, 15, 12, 6
+
+
+# NBSP variants become spaces; zero-width chars and soft hyphens are dropped.
+_TRANSLATE_INVISIBLE = {
+    0x00A0: 0x20,  # NBSP
+    0x202F: 0x20,  # narrow NBSP
+    **dict.fromkeys((0x200B, 0x200C, 0x200D, 0x2060, 0xFEFF, 0x00AD)),
+}
+# C0 controls (except \n and \t) and DEL are dropped.
+_TRANSLATE_CONTROL = {c: None for c in (*range(32), 0x7F) if c not in (0x09, 0x0A)}
+_TRANSLATE = {**_TRANSLATE_INVISIBLE, **_TRANSLATE_CONTROL}
+_WS_RE = re.compile(r"[ ]{2,}")
+# Common non-ASCII text characters (RO diacritics, typographic punctuation)
+# that need no unicodedata lookup.
+_KNOWN_OK = frozenset("ăâîșțşţĂÂÎȘȚŞŢ€–—‘’‚“”„…•·«»")
+
 
 def sanitize_pdf_text(text: str) -> str:
     if text is None:
@@ -17,116 +61,191 @@ def sanitize_pdf_text(text: str) -> str:
     if not isinstance(text, str):
         text = str(text)
 
-    replacements = {
-        "\u00a0": " ",  # NBSP
-        "\u202f": " ",  # narrow NBSP
-    }
-    for key, value in replacements.items():
-        text = text.replace(key, value)
-
-    for ch in ("\u200b", "\u200c", "\u200d", "\u2060", "\ufeff", "\u00ad"):
-        text = text.replace(ch, "")
-
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
-    text = "".join(ch for ch in text if ch == "\n" or ch == "\t" or (ord(ch) >= 32 and ord(ch) != 127))
-    text = "".join(
-        ch for ch in text
-        if ch == "\n" or ch == "\t" or unicodedata.category(ch) not in ("Cc", "Cf")
-    )
-    text = re.sub(r"[ ]{2,}", " ", text)
-    return text
+    if "\r" in text:
+        # Line endings are normalized after invisible chars are removed and
+        # before control chars are, so the two tables run as separate passes.
+        text = text.translate(_TRANSLATE_INVISIBLE)
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+        text = text.translate(_TRANSLATE_CONTROL)
+    else:
+        text = text.translate(_TRANSLATE)
+    if not text.isascii():
+        # Classify each distinct character once (set() runs in C), then drop
+        # the Cc/Cf ones with a single translate. Remaining ASCII is printable
+        # or \n/\t after the pass above.
+        drop = {
+            ord(ch) for ch in set(text).difference(_KNOWN_OK)
+            if ch >= "\x80" and unicodedata.category(ch) in ("Cc", "Cf")
+        }
+        if drop:
+            text = text.translate(dict.fromkeys(drop))
+    return _WS_RE.sub(" ", text)
 
 
 def _canonical_list(items) -> list:
     if not items:
         return []
-    return sorted([str(item).strip() for item in items if str(item).strip()])
+    return sorted(s for item in items if (s := str(item).strip()))
+
+
+_DATE_FMT = {"en": "%Y-%m-%d", "ro": "%d.%m.%Y"}
+
+# Read-only: _sanitized_labels serves the sanitized per-language view.
+_LABELS = MappingProxyType({
+    "en": MappingProxyType({
+        "title": "Decision Brief",
+        "badge": "Client-safe",
+        "status_ok": "OK (Ready)",
+        "status_issues": "Issues found",
+        "section_status": "Overall status",
+        "section_means": "What this means",
+        "section_decision": "Recommended decision",
+        "means_ok": (
+            "The website is reachable and clear enough for decisions.",
+            "Focus on quick wins to improve response and clarity.",
+        ),
+        "means_issues": (
+            "There are blockers that reduce trust or conversion.",
+            "Fix the highest-impact issues before promoting the site.",
+        ),
+        "decision_ok": "Proceed with sending this report and schedule a brief review call.",
+        "decision_issues": "Pause promotion until the top issues are resolved, then re-run.",
+        "footer_campaign": "Campaign",
+        "footer_date": "Date",
+        "tool": "Deterministic Website Audit",
+        "domain_label": "Domain",
+    }),
+    "ro": MappingProxyType({
+        "title": "Decizie rapidă",
+        "badge": "Client-safe",
+        "status_ok": "OK (Gata de trimis)",
+        "status_issues": "Probleme găsite",
+        "section_status": "Status general",
+        "section_means": "Ce înseamnă",
+        "section_decision": "Decizie recomandată",
+        "means_ok": (
+            "Website-ul este accesibil și suficient de clar pentru decizie.",
+            "Concentrați-vă pe quick wins pentru claritate și răspuns.",
+        ),
+        "means_issues": (
+            "Există blocaje care reduc încrederea sau conversia.",
+            "Rezolvați întâi problemele cu impact mare.",
+        ),
+        "decision_ok": "Trimiteți raportul și programați un scurt call de revizuire.",
+        "decision_issues": "Pauzați promovarea până la rezolvarea blocajelor, apoi re-rulați.",
+        "footer_campaign": "Campanie",
+        "footer_date": "Data",
+        "tool": "Deterministic Website Audit",
+        "domain_label": "Domeniu",
+    }),
+})
+
+
+_TXT_TEMPLATE = (
+    "{title}\n"
+    "{domain_label}: {domain}\n"
+    "\n"
+    "{section_status}: {status}\n"
+    "\n"
+    "{section_means}:\n"
+    "{means}"
+    "\n"
+    "{section_decision}:\n"
+    "{decision}\n"
+    "\n"
+    "{tool}\n"
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _build_styles(font_name: str, font_bold: str):
+    # ParagraphStyles are read-only once built; share one stylesheet per font pair.
+    styles = getSampleStyleSheet()
+    styles["Normal"].fontName = font_name
+    styles["Heading1"].fontName = font_bold
+    styles["Heading2"].fontName = font_bold
+    styles.add(ParagraphStyle(
+        name="SmallMuted",
+        parent=styles["Normal"],
+        fontName=font_name,
+        fontSize=9,
+        leading=12,
+        textColor=_GREY_500,
+    ))
+    styles.add(ParagraphStyle(
+        name="Header",
+        parent=styles["Heading1"],
+        fontName=font_bold,
+        fontSize=18,
+        leading=22,
+        textColor=_GREY_900,
+    ))
+    styles.add(ParagraphStyle(
+        name="H2",
+        parent=styles["Heading2"],
+        fontName=font_bold,
+        fontSize=12,
+        leading=15,
+        textColor=_GREY_900,
+    ))
+    return styles
+
+
+def _formatted_today(fmt: str) -> str:
+    # Batches render many briefs within the same minute; re-read the clock
+    # only when the minute bucket changes.
+    return _formatted_today_bucket(fmt, int(time.time() // 60))
 
 
-def _decision_brief_content(audit_result: dict, lang: str) -> dict:
+@functools.lru_cache(maxsize=4)
+def _formatted_today_bucket(fmt: str, bucket: int) -> str:
+    return dt.date.today().strftime(fmt)
+
+
+def _decision_brief_content(audit_result: dict, lang: str, today: dt.date | None = None) -> dict:
     lang = (lang or "en").lower().strip()
     if lang not in ("ro", "en"):
         lang = "en"
 
-    labels = {
-        "en": {
-            "title": "Decision Brief",
-            "badge": "Client-safe",
-            "status_ok": "OK (Ready)",
-            "status_issues": "Issues found",
-            "section_status": "Overall status",
-            "section_means": "What this means",
-            "section_decision": "Recommended decision",
-            "means_ok": [
-                "The website is reachable and clear enough for decisions.",
-                "Focus on quick wins to improve response and clarity.",
-            ],
-            "means_issues": [
-                "There are blockers that reduce trust or conversion.",
-                "Fix the highest-impact issues before promoting the site.",
-            ],
-            "decision_ok": "Proceed with sending this report and schedule a brief review call.",
-            "decision_issues": "Pause promotion until the top issues are resolved, then re-run.",
-            "footer_campaign": "Campaign",
-            "footer_date": "Date",
-            "tool": "Deterministic Website Audit",
-            "date_fmt": lambda: dt.date.today().strftime("%Y-%m-%d"),
-            "domain_label": "Domain",
-        },
-        "ro": {
-            "title": "Decizie rapidă",
-            "badge": "Client-safe",
-            "status_ok": "OK (Gata de trimis)",
-            "status_issues": "Probleme găsite",
-            "section_status": "Status general",
-            "section_means": "Ce înseamnă",
-            "section_decision": "Decizie recomandată",
-            "means_ok": [
-                "Website-ul este accesibil și suficient de clar pentru decizie.",
-                "Concentrați-vă pe quick wins pentru claritate și răspuns.",
-            ],
-            "means_issues": [
-                "Există blocaje care reduc încrederea sau conversia.",
-                "Rezolvați întâi problemele cu impact mare.",
-            ],
-            "decision_ok": "Trimiteți raportul și programați un scurt call de revizuire.",
-            "decision_issues": "Pauzați promovarea până la rezolvarea blocajelor, apoi re-rulați.",
-            "footer_campaign": "Campanie",
-            "footer_date": "Data",
-            "tool": "Deterministic Website Audit",
-            "date_fmt": lambda: dt.date.today().strftime("%d.%m.%Y"),
-            "domain_label": "Domeniu",
-        },
-    }[lang]
-
-    def sanitize_labels(src: dict) -> dict:
-        cleaned = {}
-        for key, value in src.items():
-            if isinstance(value, list):
-                cleaned[key] = [sanitize_pdf_text(item) for item in value]
-            elif callable(value):
-                cleaned[key] = value
-            else:
-                cleaned[key] = sanitize_pdf_text(value)
-        return cleaned
-
-    labels = sanitize_labels(labels)
-
-    mode = (audit_result.get("mode") or "").strip().lower()
-    is_ok = mode == "ok"
-
-    domain = sanitize_pdf_text((audit_result.get("url") or audit_result.get("domain") or "").strip() or "-")
-    campaign = sanitize_pdf_text((audit_result.get("campaign") or "").strip() or "-")
-    cover_date = sanitize_pdf_text(labels["date_fmt"]())
+    # PDF and TXT briefs for the same audit share one content computation.
+    # The date is part of the key so a long-lived process never reuses
+    # yesterday's cover date.
+    content = _cached_brief_content(
+        audit_result.get("url") or audit_result.get("domain") or "",
+        audit_result.get("campaign") or "",
+        audit_result.get("mode") or "",
+        lang,
+        today.strftime(_DATE_FMT[lang]) if today else _formatted_today(_DATE_FMT[lang]),
+    )
+    return dict(content, lang=lang)
+
+
+@functools.lru_cache(maxsize=4)
+def _sanitized_labels(lang: str) -> MappingProxyType:
+    # Labels are constants; sanitize each language once per process.
+    cleaned = {}
+    for key, value in _LABELS[lang].items():
+        if isinstance(value, tuple):
+            cleaned[key] = tuple(sanitize_pdf_text(item) for item in value)
+        else:
+            cleaned[key] = sanitize_pdf_text(value)
+    return MappingProxyType(cleaned)
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_brief_content(url: str, campaign: str, mode: str, lang: str, today: str) -> dict:
+    labels = _sanitized_labels(lang)
+
+    is_ok = mode.strip().lower() == "ok"
+
+    domain = sanitize_pdf_text(url.strip() or "-")
+    campaign = sanitize_pdf_text(campaign.strip() or "-")
+    cover_date = sanitize_pdf_text(today)
 
     status_text = labels["status_ok"] if is_ok else labels["status_issues"]
-    means_list = labels["means_ok"] if is_ok else labels["means_issues"]
+    means_list = tuple(labels["means_ok"] if is_ok else labels["means_issues"])
     decision_text = labels["decision_ok"] if is_ok else labels["decision_issues"]
 
-    status_text = sanitize_pdf_text(status_text)
-    means_list = [sanitize_pdf_text(item) for item in means_list]
-    decision_text = sanitize_pdf_text(decision_text)
-
     return {
         "labels": labels,
         "status_text": status_text,
@@ -138,27 +257,19 @@ def _decision_brief_content(audit_result: dict, lang: str) -> dict:
     }
 
 
-def generate_decision_brief_pdf(audit_result: dict, lang: str, output_path: str) -> str:
-    """
-    Generate a 1-page, client-safe decision brief PDF.
-    """
-    def _is_valid_ttf(path: str) -> bool:
-        try:
-            with open(path, "rb") as handle:
-                header = handle.read(4)
-            return header in (b"\x00\x01\x00\x00", b"OTTO", b"ttcf")
-        except OSError:
-            return False
+def _is_valid_ttf(path: str) -> bool:
+    try:
+        with open(path, "rb") as handle:
+            header = handle.read(4)
+        return header in (b"\x00\x01\x00\x00", b"OTTO", b"ttcf")
+    except OSError:
+        return False
 
-    data = _decision_brief_content(audit_result, lang)
-    labels = data["labels"]
-    status_text = data["status_text"]
-    means_list = data["means_list"]
-    decision_text = data["decision_text"]
-    domain = data["domain"]
-    campaign = data["campaign"]
-    cover_date = data["date"]
 
+@functools.lru_cache(maxsize=1)
+def _register_fonts() -> tuple[str, str]:
+    # Parsing the TTFs is the costliest ReportLab setup; do it once per
+    # process. Failures raise and are therefore retried on the next call.
     font_name = "ScopeSans"
     font_bold = "ScopeSans-Bold"
     here = os.path.dirname(os.path.abspath(__file__))
@@ -179,100 +290,167 @@ def generate_decision_brief_pdf(audit_result: dict, lang: str, output_path: str)
         pdfmetrics.registerFont(TTFont("ScopeSans-Bold", font_bold_path))
     else:
         font_bold = font_name
+    return font_name, font_bold
+
+
+def generate_decision_brief_pdf(
+    audit_result: dict, lang: str, output_path: str, today: dt.date | None = None
+) -> str:
+    """
+    Generate a 1-page, client-safe decision brief PDF.
+
+    Pass ``today`` to pin the cover date (reproducible batch output).
+    """
+    # Every string in `data` is already sanitized; it is drawn as-is.
+    data = _decision_brief_content(audit_result, lang, today)
+    labels = data["labels"]
+    status_text = data["status_text"]
+    means_list = data["means_list"]
+    decision_text = data["decision_text"]
+    domain = data["domain"]
+    campaign = data["campaign"]
+    cover_date = data["date"]
+
+    font_name, font_bold = _register_fonts()
+    styles = _build_styles(font_name, font_bold)
+    normal = styles["Normal"]
+    muted = styles["SmallMuted"]
+
+    # Build in memory and write the finished PDF with a single write call.
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf, pagesize=A4)
+    c.setTitle(labels["title"])
+    x0 = _LMARGIN + _INSET
+    y = _PAGE_H - _TMARGIN - _INSET
+
+    def draw_para(para: Paragraph, x: float, top: float, width: float) -> float:
+        _, h = para.wrapOn(c, width, top - _BMARGIN)
+        para.drawOn(c, x, top - h)
+        return h
+
+    def heading(value: str, top: float) -> float:
+        top -= _H2_BEFORE
+        c.setFillColor(_GREY_900)
+        c.setFont(font_bold, _H2_SIZE)
+        c.drawString(x0, top - _H2_SIZE, value)
+        return top - _H2_LEADING - _H2_AFTER
+
+    # Header: title, with the smaller badge centred against it.
+    c.setFillColor(_GREY_900)
+    c.setFont(font_bold, 18)
+    c.drawString(x0 + _INSET, y - 21, labels["title"])
+    c.setFillColor(_GREY_500)
+    c.setFont(font_name, 9)
+    c.drawString(x0 + _HEADER_COLS[0] + _INSET, y - 19, labels["badge"])
+    y -= 28 + 6
+
+    # Domain row.
+    y -= 2
+    c.drawString(x0, y - 9, f'{labels["domain_label"]}:')
+    h = draw_para(Paragraph(domain, normal), x0 + _META_LABEL_W, y, _META_VALUE_W)
+    y -= max(h, muted.leading) + 2 + 10
+
+    # Status box.
+    y = heading(labels["section_status"], y)
+    status = Paragraph(status_text, normal)
+    _, h = status.wrapOn(c, _STATUS_W - 2 * _STATUS_PAD_X, y)
+    box_h = h + 2 * _STATUS_PAD_Y
+    c.setFillColor(_GREY_50)
+    c.setStrokeColor(_GREY_300)
+    c.setLineWidth(0.6)
+    c.rect(x0, y - box_h, _STATUS_W, box_h, stroke=1, fill=1)
+    status.drawOn(c, x0 + _STATUS_PAD_X, y - _STATUS_PAD_Y - h)
+    y -= box_h + 10
+
+    y = heading(labels["section_means"], y) - 4
+    for item in means_list:
+        y -= draw_para(Paragraph(f"- {item}", normal), x0, y, _CONTENT_W)
+    y -= 10
+
+    y = heading(labels["section_decision"], y)
+    y -= draw_para(Paragraph(decision_text, normal), x0, y, _CONTENT_W)
+    y -= 18
+
+    campaign_para = Paragraph(f'{labels["footer_campaign"]}: {campaign}', muted)
+    _, footer_h = campaign_para.wrapOn(c, _FOOTER_COLS[0], y)
+    if y - 6 - max(footer_h, muted.leading) < _BMARGIN + _INSET:
+        # Long input does not fit the fixed page; let Platypus flow it onto
+        # further pages (or raise LayoutError) instead of clipping it.
+        pdf = _flowed_brief_pdf(data, styles)
+    else:
+        # Footer: rule, then campaign / date / tool in three columns.
+        c.setStrokeColor(_GREY_200)
+        c.setLineWidth(0.5)
+        c.line(x0, y, x0 + sum(_FOOTER_COLS), y)
+        y -= 6
+        campaign_para.drawOn(c, x0, y - footer_h)
+        c.setFillColor(_GREY_500)
+        c.setFont(font_name, 9)
+        c.drawString(x0 + _FOOTER_COLS[0], y - 9, f'{labels["footer_date"]}: {cover_date}')
+        c.drawString(x0 + _FOOTER_COLS[0] + _FOOTER_COLS[1], y - 9, labels["tool"])
+        c.showPage()
+        c.save()
+        pdf = buf.getvalue()
+    with open(output_path, "wb") as f:
+        f.write(pdf)
+    return output_path
 
-    styles = getSampleStyleSheet()
-    styles["Normal"].fontName = font_name
-    styles["Heading1"].fontName = font_bold
-    styles["Heading2"].fontName = font_bold
-    styles.add(ParagraphStyle(
-        name="SmallMuted",
-        parent=styles["Normal"],
-        fontName=font_name,
-        fontSize=9,
-        leading=12,
-        textColor=colors.HexColor("#6b7280"),
-    ))
-    styles.add(ParagraphStyle(
-        name="Header",
-        parent=styles["Heading1"],
-        fontName=font_bold,
-        fontSize=18,
-        leading=22,
-        textColor=colors.HexColor("#111827"),
-    ))
-    styles.add(ParagraphStyle(
-        name="H2",
-        parent=styles["Heading2"],
-        fontName=font_bold,
-        fontSize=12,
-        leading=15,
-        textColor=colors.HexColor("#111827"),
-    ))
 
+def _flowed_brief_pdf(data: dict, styles) -> bytes:
+    """Platypus layout of the brief, used when content overflows one page."""
+    labels = data["labels"]
+    normal = styles["Normal"]
+    muted = styles["SmallMuted"]
+    buf = io.BytesIO()
     doc = SimpleDocTemplate(
-        output_path,
+        buf,
         pagesize=A4,
-        leftMargin=18 * mm,
-        rightMargin=18 * mm,
-        topMargin=16 * mm,
-        bottomMargin=16 * mm,
+        leftMargin=_LMARGIN,
+        rightMargin=_RMARGIN,
+        topMargin=_TMARGIN,
+        bottomMargin=_BMARGIN,
         title=labels["title"],
     )
-
-    header_table = Table(
-        [[
-            Paragraph(sanitize_pdf_text(labels["title"]), styles["Header"]),
-            Paragraph(sanitize_pdf_text(labels["badge"]), styles["SmallMuted"]),
-        ]],
-        colWidths=[120 * mm, 40 * mm],
+    header = Table(
+        [[Paragraph(labels["title"], styles["Header"]), Paragraph(labels["badge"], muted)]],
+        colWidths=_HEADER_COLS,
         hAlign="LEFT",
     )
-    header_table.setStyle(TableStyle([
+    header.setStyle(TableStyle([
         ("ALIGN", (1, 0), (1, 0), "RIGHT"),
         ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
     ]))
-
-    meta_table = Table(
-        [
-            [Paragraph(sanitize_pdf_text(f'{labels["domain_label"]}:'), styles["SmallMuted"]), Paragraph(sanitize_pdf_text(domain), styles["Normal"])],
-        ],
-        colWidths=[30 * mm, 130 * mm],
+    meta = Table(
+        [[Paragraph(f'{labels["domain_label"]}:', muted), Paragraph(data["domain"], normal)]],
+        colWidths=(_META_LABEL_W, _META_VALUE_W),
         hAlign="LEFT",
     )
-    meta_table.setStyle(TableStyle([
+    meta.setStyle(TableStyle([
         ("LEFTPADDING", (0, 0), (-1, -1), 0),
         ("RIGHTPADDING", (0, 0), (-1, -1), 0),
         ("TOPPADDING", (0, 0), (-1, -1), 2),
         ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
     ]))
-
-    status_box = Table(
-        [[Paragraph(sanitize_pdf_text(status_text), styles["Normal"])]],
-        colWidths=[70 * mm],
-        hAlign="LEFT",
-    )
-    status_box.setStyle(TableStyle([
-        ("BOX", (0, 0), (-1, -1), 0.6, colors.HexColor("#d1d5db")),
-        ("BACKGROUND", (0, 0), (-1, -1), colors.HexColor("#f9fafb")),
-        ("LEFTPADDING", (0, 0), (-1, -1), 8),
-        ("RIGHTPADDING", (0, 0), (-1, -1), 8),
-        ("TOPPADDING", (0, 0), (-1, -1), 6),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
+    status = Table([[Paragraph(data["status_text"], normal)]], colWidths=(_STATUS_W,), hAlign="LEFT")
+    status.setStyle(TableStyle([
+        ("BOX", (0, 0), (-1, -1), 0.6, _GREY_300),
+        ("BACKGROUND", (0, 0), (-1, -1), _GREY_50),
+        ("LEFTPADDING", (0, 0), (-1, -1), _STATUS_PAD_X),
+        ("RIGHTPADDING", (0, 0), (-1, -1), _STATUS_PAD_X),
+        ("TOPPADDING", (0, 0), (-1, -1), _STATUS_PAD_Y),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), _STATUS_PAD_Y),
     ]))
-
-    means_paragraphs = [Paragraph(sanitize_pdf_text(f"- {item}"), styles["Normal"]) for item in means_list]
-
-    footer_table = Table(
+    footer = Table(
         [[
-            Paragraph(sanitize_pdf_text(f'{labels["footer_campaign"]}: {campaign}'), styles["SmallMuted"]),
-            Paragraph(sanitize_pdf_text(f'{labels["footer_date"]}: {cover_date}'), styles["SmallMuted"]),
-            Paragraph(sanitize_pdf_text(labels["tool"]), styles["SmallMuted"]),
+            Paragraph(f'{labels["footer_campaign"]}: {data["campaign"]}', muted),
+            Paragraph(f'{labels["footer_date"]}: {data["date"]}', muted),
+            Paragraph(labels["tool"], muted),
         ]],
-        colWidths=[55 * mm, 45 * mm, 55 * mm],
+        colWidths=_FOOTER_COLS,
         hAlign="LEFT",
     )
-    footer_table.setStyle(TableStyle([
-        ("LINEABOVE", (0, 0), (-1, -1), 0.5, colors.HexColor("#e5e7eb")),
+    footer.setStyle(TableStyle([
+        ("LINEABOVE", (0, 0), (-1, -1), 0.5, _GREY_200),
         ("LEFTPADDING", (0, 0), (-1, -1), 0),
         ("RIGHTPADDING", (0, 0), (-1, -1), 0),
         ("TOPPADDING", (0, 0), (-1, -1), 6),
@@ -280,27 +458,35 @@ def generate_decision_brief_pdf(audit_result: dict, lang: str, output_path: str)
         ("ALIGN", (1, 0), (1, 0), "CENTER"),
         ("ALIGN", (2, 0), (2, 0), "RIGHT"),
     ]))
-
     story = [
-        header_table,
+        header,
         Spacer(1, 6),
-        meta_table,
+        meta,
         Spacer(1, 10),
-        Paragraph(sanitize_pdf_text(labels["section_status"]), styles["H2"]),
-        status_box,
+        Paragraph(labels["section_status"], styles["H2"]),
+        status,
         Spacer(1, 10),
-        Paragraph(sanitize_pdf_text(labels["section_means"]), styles["H2"]),
+        Paragraph(labels["section_means"], styles["H2"]),
         Spacer(1, 4),
-        *means_paragraphs,
+    ]
+    story.extend(Paragraph(f"- {item}", normal) for item in data["means_list"])
+    story.extend((
         Spacer(1, 10),
-        Paragraph(sanitize_pdf_text(labels["section_decision"]), styles["H2"]),
-        Paragraph(sanitize_pdf_text(decision_text), styles["Normal"]),
+        Paragraph(labels["section_decision"], styles["H2"]),
+        Paragraph(data["decision_text"], normal),
         Spacer(1, 18),
-        footer_table,
-    ]
-
+        footer,
+    ))
     doc.build(story)
-    return output_path
+    return buf.getvalue()
+
+
+def generate_decision_briefs_batch(items: list[tuple[dict, str, str]]) -> list[str]:
+    """
+    Generate one brief PDF per (audit_result, lang, output_path), in parallel.
+    """
+    # ReportLab layout is pure Python; separate processes sidestep the GIL.
+    return run_in_processes(generate_decision_brief_pdf, items)
 
 
 def generate_decision_brief_txt(audit_result: dict, lang: str, output_path: str) -> None:
@@ -314,23 +500,46 @@ def generate_decision_brief_txt(audit_result: dict, lang: str, output_path: str)
     decision_text = data["decision_text"]
     domain = data["domain"]
     campaign = data["campaign"]
-    lines = [
-        sanitize_pdf_text(labels["title"]),
-        sanitize_pdf_text(f'{labels["domain_label"]}: {domain}'),
-        "",
-        sanitize_pdf_text(f'{labels["section_status"]}: {status_text}'),
-        "",
-        sanitize_pdf_text(labels["section_means"] + ":"),
-    ]
-    for item in _canonical_list(means_list):
-        lines.append(sanitize_pdf_text(f"- {item}"))
-    lines.extend([
-        "",
-        sanitize_pdf_text(labels["section_decision"] + ":"),
-        sanitize_pdf_text(decision_text),
-        "",
-        sanitize_pdf_text(labels["tool"]),
-    ])
+    means = "".join(f"- {item}\n" for item in _canonical_list(means_list))
+    text = _TXT_TEMPLATE.format(
+        title=labels["title"],
+        domain_label=labels["domain_label"],
+        domain=domain,
+        section_status=labels["section_status"],
+        status=status_text,
+        section_means=labels["section_means"],
+        means=means,
+        section_decision=labels["section_decision"],
+        decision=decision_text,
+        tool=labels["tool"],
+    )
 
     with open(output_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines).strip() + "\n")
+        # sanitize_pdf_text never joins lines, so one pass over the whole
+        # document matches sanitizing each line.
+        f.write(sanitize_pdf_text(text).strip() + "\n")
+
+
+_BRIEF_WRITERS = {
+    "pdf": generate_decision_brief_pdf,
+    "txt": generate_decision_brief_txt,
+}
+
+
+def _write_brief(audit_result: dict, lang: str, fmt: str, output_path: str) -> str:
+    _BRIEF_WRITERS[fmt](audit_result, lang, output_path)
+    return output_path
+
+
+def generate_all_briefs(audit_result: dict, out_dir: str, langs=("ro", "en"), fmts=("pdf", "txt")) -> list[str]:
+    """
+    Write Decision_Brief_<LANG>.<fmt> for every language/format pair, in parallel.
+    """
+    jobs = [
+        (audit_result, lang, fmt, os.path.join(out_dir, f"Decision_Brief_{lang.upper()}.{fmt}"))
+        for lang in langs
+        for fmt in fmts
+    ]
+    workers = min(len(jobs), os.cpu_count() or 1)
+    # Each worker registers the fonts once up front, not per task.
+    return run_in_processes(_write_brief, jobs, max_workers=workers, initializer=_register_fonts)
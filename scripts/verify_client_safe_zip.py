@@ -1,9 +1,32 @@
 #!/usr/bin/env python3
+import re
 import sys
 import zipfile
 
 TEXT_EXTS = (".json", ".md", ".txt")
 
+# Every banned-entry rule as one alternation, scanned once per name:
+# macOS metadata, logs, bytecode caches, virtualenvs and node_modules.
+_BANNED_RE = re.compile(
+    r"^__MACOSX/"
+    r"|(?:^|/)\._"
+    r"|\.DS_Store\Z"
+    r"|\.(?i:log|pyc)\Z"
+    r"|/__pycache__/"
+    r"|/(?:\.venv|venv|node_modules)/"
+)
+
+# ASCII needles match the same bytes in UTF-8, so text entries are scanned
+# without decoding them.
+_PATH_NEEDLES = (b"/Users/", b"/home/")
+_NOTES_NEEDLES = (
+    b"scope_repo=",
+    b"scope_invoked=",
+    b"scope_available=",
+    b"scope_evidence_dir",
+    b'"notes"',
+)
+
 
 def main() -> int:
     if len(sys.argv) != 2:
@@ -11,8 +34,9 @@ def main() -> int:
         return 2
     zip_path = sys.argv[1]
     with zipfile.ZipFile(zip_path, "r") as zf:
-        names = zf.namelist()
-        name_set = set(names)
+        # infolist() hands back the archive's own list; namelist() would copy it.
+        infos = zf.infolist()
+        name_set = {info.filename for info in infos}
         has_ro = "deliverables/Decision_Brief_RO.pdf" in name_set
         has_en = "deliverables/Decision_Brief_EN.pdf" in name_set
         if has_ro and has_en:
@@ -39,59 +63,30 @@ def main() -> int:
             if req not in name_set:
                 print(f"ERROR missing required: {req}")
                 return 2
-        for name in names:
+        names = []
+        for info in infos:
+            name = info.filename
             if name not in allowlist:
                 print(f"ERROR unexpected entry: {name}")
                 return 2
-        for name in names:
-            lower = name.lower()
-            if name.startswith("__MACOSX/"):
-                print(f"ERROR banned entry: {name}")
-                return 2
-            if "/._" in name or name.startswith("._"):
-                print(f"ERROR banned entry: {name}")
-                return 2
-            if name.endswith(".DS_Store"):
-                print(f"ERROR banned entry: {name}")
-                return 2
-            if lower.endswith(".log"):
+            if _BANNED_RE.search(name):
                 print(f"ERROR banned entry: {name}")
                 return 2
-            if "/__pycache__/" in name:
-                print(f"ERROR banned entry: {name}")
-                return 2
-            if lower.endswith(".pyc"):
-                print(f"ERROR banned entry: {name}")
-                return 2
-            if "/.venv/" in name or "/venv/" in name or "/node_modules/" in name:
-                print(f"ERROR banned entry: {name}")
-                return 2
-            if lower.endswith(TEXT_EXTS):
+            if name.lower().endswith(TEXT_EXTS):
                 try:
-                    data = zf.read(name)
+                    with zf.open(info) as fh:
+                        data = fh.read()
                 except Exception:
                     print(f"ERROR could not read: {name}")
                     return 2
-                try:
-                    text = data.decode("utf-8", errors="ignore")
-                except Exception:
-                    text = ""
-                if "/Users/" in text or "/home/" in text:
+                if any(needle in data for needle in _PATH_NEEDLES):
                     print(f"ERROR leaked path in: {name}")
                     return 2
-                if (
-                    "scope_repo=" in text
-                    or "scope_invoked=" in text
-                    or "scope_available=" in text
-                    or "scope_evidence_dir" in text
-                    or "\"notes\"" in text
-                ):
+                if any(needle in data for needle in _NOTES_NEEDLES):
                     print(f"ERROR leaked notes in: {name}")
                     return 2
-        print("bad_entries_count=0")
-        print("ZIP contents:")
-        for name in names:
-            print(name)
+            names.append(name)
+        sys.stdout.write("bad_entries_count=0\nZIP contents:\n" + "".join(f"{name}\n" for name in names))
     return 0
 
 
@@ -2,7 +2,10 @@
 import json
 import os
 import sys
-from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "lib"))
+from _json_out import json_bytes  # noqa: E402
+from _utc import utc_now_iso  # noqa: E402
 
 
 def _best_lang(run_dir: str, run_base: str) -> str:
@@ -34,13 +37,18 @@ def _best_domain(run_base: str) -> str:
     return parts[-1]
 
 
-def _has_pdf(dir_path: str) -> bool:
-    if not os.path.isdir(dir_path):
-        return False
-    for name in os.listdir(dir_path):
-        if name.lower().endswith(".pdf"):
-            return True
-    return False
+def _files(dir_path: str) -> set[str]:
+    # One directory read answers every artifact check for that directory;
+    # entry types come from the listing itself, so no per-entry stat is needed.
+    try:
+        with os.scandir(dir_path) as it:
+            return {e.name for e in it if e.is_file()}
+    except OSError:
+        return set()
+
+
+def _has_pdf(names: set[str]) -> bool:
+    return any(name.lower().endswith(".pdf") for name in names)
 
 
 def main() -> int:
@@ -56,27 +64,28 @@ def main() -> int:
     os.makedirs(final_dir, exist_ok=True)
 
     run_base = os.path.basename(run_dir)
+    final_files = _files(final_dir)
     manifest = {
         "run_dir": run_base,
         "domain": _best_domain(run_base),
         "lang": _best_lang(run_dir, run_base),
         "artifacts": {
-            "audit_report_pdf": os.path.isfile(os.path.join(run_dir, "audit", "report.pdf")),
-            "astra_decision_pdf": _has_pdf(os.path.join(run_dir, "astra", "deliverables")),
-            "tool2": _has_pdf(os.path.join(run_dir, "action_scope")),
-            "tool3": _has_pdf(os.path.join(run_dir, "proof_pack")),
-            "tool4": _has_pdf(os.path.join(run_dir, "regression")),
-            "master_pdf": os.path.isfile(os.path.join(final_dir, "master.pdf")),
-            "bundle_zip": os.path.isfile(os.path.join(final_dir, "client_safe_bundle.zip")),
+            "audit_report_pdf": "report.pdf" in _files(os.path.join(run_dir, "audit")),
+            "astra_decision_pdf": _has_pdf(_files(os.path.join(run_dir, "astra", "deliverables"))),
+            "tool2": _has_pdf(_files(os.path.join(run_dir, "action_scope"))),
+            "tool3": _has_pdf(_files(os.path.join(run_dir, "proof_pack"))),
+            "tool4": _has_pdf(_files(os.path.join(run_dir, "regression"))),
+            "master_pdf": "master.pdf" in final_files,
+            "bundle_zip": "client_safe_bundle.zip" in final_files,
         },
-        "generated_utc": datetime.now(timezone.utc).isoformat(),
+        "generated_utc": utc_now_iso(),
         "version": "v1",
     }
 
     out_path = os.path.join(final_dir, "manifest.json")
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(manifest, f, sort_keys=True, separators=(",", ":"))
-        f.write("\n")
+    payload = json_bytes(manifest)
+    with open(out_path, "wb") as f:
+        f.write(payload)
     print("OK manifest")
     return 0
 
@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
-import json
 import os
 import sys
-from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "lib"))
+from _json_out import json_bytes  # noqa: E402
+from _utc import utc_now_iso  # noqa: E402
 
 
 TOOL_BY_FOLDER = {
@@ -35,13 +37,13 @@ def main() -> int:
     summary = {
         "artifacts": {"pdf": pdf_rel},
         "folder": folder,
-        "generated_utc": datetime.now(timezone.utc).isoformat(),
+        "generated_utc": utc_now_iso(),
         "tool": TOOL_BY_FOLDER[folder],
     }
     out_path = os.path.join(tool_dir, "summary.json")
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(summary, f, sort_keys=True, indent=2)
-        f.write("\n")
+    payload = json_bytes(summary, indent=True)
+    with open(out_path, "wb") as f:
+        f.write(payload)
     return 0
 
 
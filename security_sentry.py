@@ -5,8 +5,11 @@ Usage:
     issues = check_security_headers(headers_dict)
 """
 
+import re
 from typing import Dict, List, Any
 
+from requests.structures import CaseInsensitiveDict
+
 REQUIRED_HEADERS = {
     "Strict-Transport-Security": "Missing HSTS (HTTPS enforcement).",
     "Content-Security-Policy": "Missing Content Security Policy (XSS protection).",
@@ -15,21 +18,30 @@ REQUIRED_HEADERS = {
     "Referrer-Policy": "Missing Referrer Policy."
 }
 
+_REQUIRED_LOWER = {header.lower(): msg for header, msg in REQUIRED_HEADERS.items()}
+
+# A digit in the Server header means a version number is exposed.
+_DIGIT_RE = re.compile(r"\d")
+
 def check_security_headers(headers: Dict[str, Any]) -> List[str]:
     """
     Checks for missing or misconfigured security headers.
     """
     issues = []
-    # Normalize headers to lowercase for easy lookup
-    h_lower = {k.lower(): v for k, v in headers.items()}
-    
-    for header, msg in REQUIRED_HEADERS.items():
-        if header.lower() not in h_lower:
+    # Normalize headers to lowercase for easy lookup (requests' headers
+    # already look up case-insensitively)
+    if isinstance(headers, CaseInsensitiveDict):
+        h_lower = headers
+    else:
+        h_lower = {k.lower(): v for k, v in headers.items()}
+
+    for header, msg in _REQUIRED_LOWER.items():
+        if header not in h_lower:
             issues.append(msg)
             
     # Check for info leakage
     server = h_lower.get("server", "").lower()
-    if any(char.isdigit() for char in server):
+    if _DIGIT_RE.search(server):
         issues.append(f"Server version leakage: '{server}'.")
         
     powered_by = h_lower.get("x-powered-by", "")
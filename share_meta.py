@@ -1,31 +1,81 @@
 # share_meta.py
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None  # Optional: faster parser; BeautifulSoup is the fallback
+
+from _html_utils import as_soup
 from net_guardrails import DEFAULT_HEADERS, DEFAULT_TIMEOUT, MAX_REDIRECTS
 
 HEADERS = DEFAULT_HEADERS
 
+# One pooled session for all image checks, so repeated hosts reuse
+# keep-alive connections instead of paying a fresh TCP/TLS handshake.
+_SESSION = requests.Session()
+_SESSION.max_redirects = MAX_REDIRECTS
+_SESSION.headers.update(HEADERS)
+_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+# Shared across pages so the og:image / twitter:image checks overlap without
+# spinning up threads per call.
+_HEAD_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="share-meta-head")
+
+
+def _parse_head(html: str | BeautifulSoup) -> tuple[str, list[dict]]:
+    """Return the first canonical link href and the attributes of every <meta>."""
+    if LexborHTMLParser is not None and not isinstance(html, BeautifulSoup):
+        tree = LexborHTMLParser(html or "")
+        canonical_url = ""
+        for link in tree.css("link[rel]"):
+            if "canonical" in (link.attributes.get("rel") or "").lower().split():
+                href = link.attributes.get("href")
+                if isinstance(href, str):
+                    canonical_url = href.strip()
+                break
+        return canonical_url, [meta.attributes for meta in tree.css("meta")]
+
+    soup = as_soup(html)
+    canonical_url = ""
+    # Soup Sieve's matcher instead of a Python callable per <link> tag; `~=`
+    # matches "canonical" as one token of a multi-valued rel, like lexbor above.
+    link = soup.select_one('link[rel~="canonical" i]')
+    if link is not None:
+        href = link.get("href")
+        if isinstance(href, str):
+            canonical_url = href.strip()
+    return canonical_url, [meta.attrs for meta in soup.find_all("meta")]
+
 
-def _collect_meta_values(soup: BeautifulSoup, key_attr: str, key_value: str) -> list[str]:
-    vals: list[str] = []
-    for meta in soup.find_all("meta"):
-        k = meta.get(key_attr)
-        if not isinstance(k, str):
+def _collect_meta(metas: list[dict], og_keys: list[str], twitter_keys: list[str]) -> tuple[dict, dict]:
+    """Single pass over <meta> tags: og:* keys by property, twitter:* by name."""
+    og: dict[str, list[str]] = {k: [] for k in og_keys}
+    tw: dict[str, list[str]] = {k: [] for k in twitter_keys}
+    for meta in metas:
+        content = meta.get("content")
+        if not isinstance(content, str):
             continue
-        if k.strip().lower() != key_value:
+        c = content.strip()
+        if not c:
             continue
-        content = meta.get("content")
-        if isinstance(content, str):
-            c = content.strip()
-            if c:
-                vals.append(c)
-    return vals
+        prop = meta.get("property")
+        if isinstance(prop, str) and (key := prop.strip().lower()) in og:
+            og[key].append(c)
+        name = meta.get("name")
+        if isinstance(name, str) and (key := name.strip().lower()) in tw:
+            tw[key].append(c)
+    return og, tw
 
 
 def _first_or_empty(values: list[str]) -> str:
@@ -43,9 +93,7 @@ def _head_status(url: str, timeout: int = DEFAULT_TIMEOUT) -> dict[str, Any]:
     We return structured evidence instead of asserting certainty.
     """
     try:
-        session = requests.Session()
-        session.max_redirects = MAX_REDIRECTS
-        r = session.head(url, headers=HEADERS, timeout=timeout, allow_redirects=True)
+        r = _SESSION.head(url, timeout=timeout, allow_redirects=True)
         return {
             "ok": True,
             "status_code": int(r.status_code),
@@ -63,24 +111,38 @@ def _head_status(url: str, timeout: int = DEFAULT_TIMEOUT) -> dict[str, Any]:
         }
 
 
-def extract_share_meta(html: str, page_url: str | None = None) -> dict[str, Any]:
+def _head_status_memo(url: str, head_cache: dict[str, dict[str, Any]] | None) -> dict[str, Any]:
+    """_head_status through the caller's per-run cache, returned as a copy.
+
+    The cache lives only as long as the caller keeps it (one audit run), so
+    transient failures and fixed images are re-checked on the next run.
+    """
+    if head_cache is None:
+        return _head_status(url)
+    status = head_cache.get(url)
+    if status is None:
+        status = head_cache[url] = _head_status(url)
+    return dict(status)
+
+
+def extract_share_meta(
+    html: str | BeautifulSoup,
+    page_url: str | None = None,
+    head_cache: dict[str, dict[str, Any]] | None = None,
+) -> dict[str, Any]:
     """Extract Open Graph and Twitter card metadata from a page.
 
     This is deterministic extraction from HTML. Optionally uses a best-effort HEAD
     request for og:image/twitter:image validation.
 
+    `html` may also be an already parsed BeautifulSoup tree of the page.
+    Pass the same `head_cache` dict for every page of one audit run to check
+    repeated share images only once.
+
     Returns a nested dict suitable to store in audit.json under signals["share_meta"].
     """
 
-    soup = BeautifulSoup(html or "", "html.parser")
-
-    # Canonical
-    canonical_url = ""
-    link = soup.find("link", rel=lambda x: isinstance(x, str) and x.lower() == "canonical")
-    if link is not None:
-        href = link.get("href")
-        if isinstance(href, str):
-            canonical_url = href.strip()
+    canonical_url, metas = _parse_head(html)
 
     base_for_relative = canonical_url or (page_url or "")
 
@@ -99,8 +161,7 @@ def extract_share_meta(html: str, page_url: str | None = None) -> dict[str, Any]
         "twitter:image",
     ]
 
-    og: dict[str, list[str]] = {k: _collect_meta_values(soup, "property", k) for k in og_keys}
-    tw: dict[str, list[str]] = {k: _collect_meta_values(soup, "name", k) for k in twitter_keys}
+    og, tw = _collect_meta(metas, og_keys, twitter_keys)
 
     # Normalized single values (first) for convenience
     og_first = {k: _first_or_empty(v) for k, v in og.items()}
@@ -119,8 +180,18 @@ def extract_share_meta(html: str, page_url: str | None = None) -> dict[str, Any]
         tw_image_absolute = urljoin(base_for_relative, tw_image)
 
     # Best-effort checks (evidence only)
-    og_image_check = _head_status(og_image_absolute or og_image) if (og_image_absolute or og_image) else {}
-    tw_image_check = _head_status(tw_image_absolute or tw_image) if (tw_image_absolute or tw_image) else {}
+    og_check_url = og_image_absolute or og_image
+    tw_check_url = tw_image_absolute or tw_image
+    if og_check_url and tw_check_url and og_check_url != tw_check_url:
+        og_future = _HEAD_POOL.submit(_head_status_memo, og_check_url, head_cache)
+        tw_image_check = _head_status_memo(tw_check_url, head_cache)
+        og_image_check = og_future.result()
+    else:
+        og_image_check = _head_status_memo(og_check_url, head_cache) if og_check_url else {}
+        if tw_check_url == og_check_url:
+            tw_image_check = dict(og_image_check)
+        else:
+            tw_image_check = _head_status_memo(tw_check_url, head_cache) if tw_check_url else {}
 
     return {
         "canonical_url": canonical_url,
@@ -9,6 +9,10 @@ CORE_TW = ["twitter:card"]
 
 ALLOWED_TW_CARDS = {"summary", "summary_large_image", "app", "player"}
 
+# Evidence keeps only the first few values per duplicated tag (plus the full
+# count), so pathological pages don't bloat audit.json.
+MAX_DUPLICATE_EVIDENCE = 5
+
 
 def _has_values(meta_map: dict[str, list[str]], key: str) -> bool:
     v = meta_map.get(key) or []
@@ -20,6 +24,13 @@ def _first(meta_first: dict[str, str], key: str) -> str:
     return v if isinstance(v, str) else ""
 
 
+def _duplicate_evidence(dups: dict[str, list[str]]) -> dict[str, Any]:
+    return {
+        "duplicates": {k: v[:MAX_DUPLICATE_EVIDENCE] for k, v in dups.items()},
+        "counts": {k: len(v) for k, v in dups.items()},
+    }
+
+
 def build_share_meta_findings(signals: dict, lang: str = "en") -> list[dict[str, Any]]:
     """Create Findings related to share previews (Open Graph + Twitter cards).
 
@@ -87,7 +98,7 @@ def build_share_meta_findings(signals: dict, lang: str = "en") -> list[dict[str,
             "description_ro": "Au fost găsite mai multe valori pentru unul sau mai multe tag-uri Open Graph. Platformele sociale pot alege valoarea greșită.",
             "recommendation_en": "Keep a single value per Open Graph tag (especially title, description, image, url).",
             "recommendation_ro": "Păstrați o singură valoare per tag Open Graph (mai ales title, description, image, url).",
-            "evidence": {"duplicates": dup_og},
+            "evidence": _duplicate_evidence(dup_og),
         })
 
     # og:url vs canonical mismatch
@@ -212,7 +223,7 @@ def build_share_meta_findings(signals: dict, lang: str = "en") -> list[dict[str,
             "description_ro": "Au fost găsite mai multe valori pentru unul sau mai multe tag-uri de previzualizare. Platformele pot alege valoarea greșită.",
             "recommendation_en": "Keep a single value per Twitter card tag (especially twitter:card, title, description, image).",
             "recommendation_ro": "Păstrați o singură valoare per tag de previzualizare (mai ales titlu, descriere, imagine).",
-            "evidence": {"duplicates": dup_tw},
+            "evidence": _duplicate_evidence(dup_tw),
         })
 
     # Positive note (optional)
@@ -6,41 +6,81 @@ Usage:
 """
 
 import re
+from functools import lru_cache
 from bs4 import BeautifulSoup
 
+from _html_utils import as_soup
+
 def normalize_text(s: str) -> str:
-    return re.sub(r"\s+", " ", s).strip().lower()
+    # split() collapses the same whitespace set as r"\s+", without the regex engine.
+    return " ".join(s.split()).lower()
+
+# Keywords per category; PATTERNS and the substring pre-check below are both
+# built from these, so the two can't drift apart.
+KEYWORDS = {
+    "booking": ("book", "booking", "bookings", "appointment", "appointments", "reservation", "reservations", "schedule", "programare", "programari", "rezervare", "rezervari"),
+    "contact": ("contact", "contacts", "contact us", "contacteaza", "contactează", "email", "phone", "call", "whatsapp", "adresă", "adresa", "locație", "locatie", "location", "locations"),
+    "pricing": ("price", "prices", "pricing", "cost", "costs", "rates", "lei", "ron", "eur", "€", "preț", "pret", "prețuri", "preturi", "tarif", "tarife"),
+    "services": ("services", "service", "servicii", "serviciu", "menu", "oferta", "oferte", "tuns", "vopsit", "manichiura", "pedichiura", "coafat", "tratament", "tratamente"),
+}
 
 # Regex Patterns
 # \b boundary ensures we match "book" but not "bookkeeper" (unless desired)
 PATTERNS = {
-    "booking": r"\b(book|booking|bookings|appointment|appointments|reservation|reservations|schedule|programare|programari|rezervare|rezervari)\b",
-    "contact": r"\b(contact|contacts|contact us|contacteaza|contactează|email|phone|call|whatsapp|adresă|adresa|locație|locatie|location|locations)\b",
-    "pricing": r"\b(price|prices|pricing|cost|costs|rates|lei|ron|eur|€|preț|pret|prețuri|preturi|tarif|tarife)\b",
-    "services": r"\b(services|service|servicii|serviciu|menu|oferta|oferte|tuns|vopsit|manichiura|pedichiura|coafat|tratament|tratamente)\b"
+    key: r"\b(" + "|".join(map(re.escape, words)) + r")\b"
+    for key, words in KEYWORDS.items()
 }
 
-def detect_page_signals(html: str) -> dict:
+# All categories fused into one alternation: a single scan reports every
+# category present (via the named group of each match). The keyword sets are
+# disjoint and word-bounded, so this matches searching each pattern alone.
+_SIGNAL_RE = re.compile(
+    "|".join(f"(?P<{key}>{pattern})" for key, pattern in PATTERNS.items()),
+    re.IGNORECASE,
+)
+
+def _sentinels(words: tuple) -> tuple:
+    # The keywords minus any that contain a shorter keyword of the same
+    # category (which already covers them).
+    return tuple(w for w in words if not any(o != w and o in w for o in words))
+
+# Plain substring pre-check per category: lowercase text can only match a
+# category's regex if it contains one of its keywords. The exceptions are the
+# two lowercase letters IGNORECASE folds onto ASCII ones ("ı" -> i, "ſ" -> s);
+# text containing them skips the pre-check.
+_SENTINELS = {key: _sentinels(words) for key, words in KEYWORDS.items()}
+_FOLD_ODDITIES = ("\u0131", "\u017f")
+
+def detect_page_signals(html: str | BeautifulSoup) -> dict:
     """
-    Analyzes HTML content for business signals using robust regex.
+    Analyzes HTML content (or an already parsed tree) for business signals
+    using robust regex.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = as_soup(html)
     text = normalize_text(soup.get_text(" ", strip=True))
     
-    # Also check clickable elements specifically
-    clickable_texts = []
-    for el in soup.find_all(["a", "button"]):
-        t = el.get_text(" ", strip=True)
-        if t:
-            clickable_texts.append(normalize_text(t))
-    clickable = " ".join(clickable_texts)
-
-    results = {}
-    for key, pattern in PATTERNS.items():
-        # Check in general text or specifically in clickable elements
-        found = bool(re.search(pattern, text, re.IGNORECASE)) or \
-                bool(re.search(pattern, clickable, re.IGNORECASE))
-        results[f"{key}_detected"] = found
+    # Also check clickable elements specifically (normalized once, joined)
+    clickable = normalize_text(" ".join(
+        t for el in soup.find_all(["a", "button"]) if (t := el.get_text(" ", strip=True))
+    ))
+
+    # Check general text and clickable elements in one scan; the newline
+    # separator keeps multi-word keywords from matching across the two.
+    haystack = f"{text}\n{clickable}"
+    if any(c in haystack for c in _FOLD_ODDITIES):
+        candidates = len(PATTERNS)
+    else:
+        candidates = sum(
+            any(w in haystack for w in words) for words in _SENTINELS.values()
+        )
+    hits = set()
+    if candidates:
+        # Regex confirms word boundaries; stop once every candidate is seen.
+        for m in _SIGNAL_RE.finditer(haystack):
+            hits.add(m.lastgroup)
+            if len(hits) == candidates:
+                break
+    results = {f"{key}_detected": key in hits for key in PATTERNS}
 
     # Legacy scoring compatibility
     score = 0
@@ -52,19 +92,30 @@ def detect_page_signals(html: str) -> dict:
 
     return results
 
+@lru_cache(maxsize=4096)
+def _url_hits(url: str) -> frozenset:
+    # URLs repeat across pages and re-audits; cache the (immutable) hits so
+    # every caller still gets a fresh result dict.
+    return frozenset(m.lastgroup for m in _SIGNAL_RE.finditer(normalize_text(url)))
+
 def detect_url_signals(url: str) -> dict:
     """
     Analyzes URL string for business signals.
     """
-    text = normalize_text(url)
-    results = {}
-    found_any = False
-    
-    for key, pattern in PATTERNS.items():
-        found = bool(re.search(pattern, text, re.IGNORECASE))
-        results[f"{key}_detected"] = found
-        if found:
-            found_any = True
-            
-    results["found_any"] = found_any
+    hits = _url_hits(url)
+    results = {f"{key}_detected": key in hits for key in PATTERNS}
+    results["found_any"] = bool(hits)
     return results
+
+def detect_url_signals_batch(urls: list[str]) -> list[dict]:
+    """
+    Analyzes many URL strings at once; same result as detect_url_signals per URL.
+    """
+    keys = tuple(PATTERNS)
+    out = []
+    for url in urls:
+        hits = _url_hits(url)
+        results = {f"{key}_detected": key in hits for key in keys}
+        results["found_any"] = bool(hits)
+        out.append(results)
+    return out
@@ -0,0 +1,52 @@
+"""
+signal_runner.py - Per-page signal extraction from a single parse.
+
+Usage:
+    signals = run_signals(html_text, page_url)
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from bs4 import BeautifulSoup
+
+from _html_utils import as_soup
+from share_meta import extract_share_meta
+from signal_detector import detect_page_signals
+from social_signals import extract_social_signals
+
+# Shared across pages; share_meta spends most of its time waiting on HEAD
+# checks, so it overlaps with the CPU-bound extractors.
+_POOL = ThreadPoolExecutor(max_workers=3, thread_name_prefix="signals")
+
+
+def submit_signals(soup: BeautifulSoup, page_url: str | None = None, head_cache: dict | None = None) -> dict:
+    """
+    Starts share_meta and social extraction on an already parsed tree.
+
+    Returns {"share_meta": Future, "social": Future}, so the caller can run
+    its own page-level extractor on the same tree meanwhile and handle each
+    extractor's errors separately.
+    """
+    return {
+        "share_meta": _POOL.submit(extract_share_meta, soup, page_url, head_cache),
+        "social": _POOL.submit(extract_social_signals, soup),
+    }
+
+
+def run_signals(html: str, page_url: str | None = None, head_cache: dict | None = None) -> dict:
+    """
+    Parses the HTML once and runs share_meta, social and page-signal
+    extraction on that tree concurrently. `head_cache` is passed through to
+    extract_share_meta.
+
+    Returns {"share_meta": ..., "social": ..., "page": ...} with the same
+    values as calling each extractor on the HTML string.
+    """
+    soup = as_soup(html)
+    pending = submit_signals(soup, page_url, head_cache)
+    page = detect_page_signals(soup)
+    return {
+        "share_meta": pending["share_meta"].result(),
+        "social": pending["social"].result(),
+        "page": page,
+    }
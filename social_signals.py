@@ -1,8 +1,23 @@
 # social_signals.py
 from __future__ import annotations
 
+import re
+import sys
+
 from bs4 import BeautifulSoup
 
+from _html_utils import as_soup
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None  # Optional: faster parser; BeautifulSoup is the fallback
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # Optional: one-pass needle matching; substring loops are the fallback
+
 # Deterministic: no API calls, no follower counts, no "social ranking" claims.
 # We only detect presence of links to common social/contact channels in <a href="...">.
 
@@ -25,19 +40,63 @@ SHARE_PATTERNS = [
     "share?",  # generic
 ]
 
+# Lowercased and interned once at import: hrefs are lowercased before matching,
+# so the needles must be too, and repeated literals share one object.
+SOCIAL_DOMAINS = {k: tuple(sys.intern(d.lower()) for d in v) for k, v in SOCIAL_DOMAINS.items()}
+SHARE_PATTERNS = tuple(sys.intern(p.lower()) for p in SHARE_PATTERNS)
+
+
+def _build_automaton():
+    """One automaton for every social domain and share pattern.
+
+    Each needle maps to the platforms it identifies; None marks a share pattern.
+    """
+    if ahocorasick is None:
+        return None
+    needles: dict[str, set] = {}
+    for platform, domains in SOCIAL_DOMAINS.items():
+        for d in domains:
+            needles.setdefault(d, set()).add(platform)
+    for p in SHARE_PATTERNS:
+        needles.setdefault(p, set()).add(None)
+    automaton = ahocorasick.Automaton()
+    for needle, kinds in needles.items():
+        automaton.add_word(needle, frozenset(kinds))
+    automaton.make_automaton()
+    return automaton
+
+
+_AUTOMATON = _build_automaton()
 
-def _is_share_link(href: str) -> bool:
-    h = (href or "").lower()
-    return any(p in h for p in SHARE_PATTERNS)
 
+def _is_share_link(href_l: str) -> bool:
+    """`href_l` must already be lowercased."""
+    return any(p in href_l for p in SHARE_PATTERNS)
 
-def extract_social_signals(html: str) -> dict:
-    soup = BeautifulSoup(html or "", "html.parser")
 
+# Lexbor keeps <template> contents out of the DOM it searches, while
+# BeautifulSoup parses them inline; such documents take the bs4 path.
+_TEMPLATE_RE = re.compile(r"<template", re.IGNORECASE)
+
+
+def _iter_hrefs(html: str | BeautifulSoup):
+    """Yield the href attribute of every <a> (None when absent)."""
+    if (
+        LexborHTMLParser is not None
+        and not isinstance(html, BeautifulSoup)
+        and not _TEMPLATE_RE.search(html or "")
+    ):
+        for a in LexborHTMLParser(html or "").css("a"):
+            yield a.attributes.get("href")
+        return
+    for a in as_soup(html).find_all("a"):
+        yield a.get("href")
+
+
+def extract_social_signals(html: str | BeautifulSoup) -> dict:
     found: dict[str, list[str]] = {k: [] for k in SOCIAL_DOMAINS}
 
-    for a in soup.find_all("a"):
-        raw_href = a.get("href")
+    for raw_href in _iter_hrefs(html):
         if not isinstance(raw_href, str):
             continue
 
@@ -51,6 +110,15 @@ def extract_social_signals(html: str) -> dict:
         if href_l.startswith("#") or href_l.startswith("javascript:"):
             continue
 
+        if _AUTOMATON is not None:
+            # All needles in one scan; any share/intent hit excludes the link.
+            hits = set().union(*(kinds for _, kinds in _AUTOMATON.iter(href_l)))
+            if None in hits:
+                continue
+            for platform in hits:
+                found[platform].append(href)
+            continue
+
         # Ignore share/intent URLs
         if _is_share_link(href_l):
             continue
@@ -60,15 +128,7 @@ def extract_social_signals(html: str) -> dict:
                 found[platform].append(href)
 
     # Deduplicate while preserving order
-    for k, urls in found.items():
-        seen = set()
-        deduped = []
-        for u in urls:
-            if u in seen:
-                continue
-            seen.add(u)
-            deduped.append(u)
-        found[k] = deduped
+    found = {k: list(dict.fromkeys(urls)) for k, urls in found.items()}
 
     result: dict[str, object] = {}
     for platform, urls in found.items():
@@ -6,7 +6,18 @@ Usage:
 """
 
 import re
-from typing import Dict, List
+import threading
+from typing import Dict, List, Tuple, Union
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # Optional: one-pass literal matching; substring checks are the fallback
+
+try:
+    import re2
+except ImportError:
+    re2 = None  # Optional: linear-time matching for non-literal signatures; stdlib re is the fallback
 
 # Signatures for detection
 # Format: "Category": {"Technology": [Regex/Checks]}
@@ -104,28 +115,261 @@ SIGNATURES = {
     }
 }
 
-def detect_tech_stack(html: str, headers: Dict[str, str] = None) -> Dict[str, List[str]]:
+# Compiled once at import; SIGNATURES stays the source of truth.
+_COMPILED = {
+    category: {
+        tech_name: [re.compile(p, re.IGNORECASE) for p in patterns]
+        for tech_name, patterns in techs.items()
+    }
+    for category, techs in SIGNATURES.items()
+}
+
+def _as_literal(pattern: str):
+    """
+    The lowercase plain-text form of a pattern with no regex syntax beyond
+    escaped punctuation (e.g. r"cdn\\.shopify\\.com"), else None.
+    """
+    if re.search(r"\\[A-Za-z0-9]", pattern):
+        return None
+    if re.search(r"[.^$*+?{}\[\]|()]", re.sub(r"\\.", "", pattern)):
+        return None
+    return re.sub(r"\\(.)", r"\1", pattern).lower()
+
+def _compile_lower(pattern: str) -> re.Pattern:
+    """
+    Compile for matching already-lowercased content: lowercase the pattern and
+    drop IGNORECASE, so the engine doesn't case-fold every comparison. Patterns
+    with letter escapes (\\S, \\W, ...) would change meaning and keep the flag.
+    """
+    if re.search(r"\\[A-Za-z]", pattern):
+        return re.compile(pattern, re.IGNORECASE)
+    return re.compile(pattern.lower())
+
+def _uses_re2(pattern: str) -> bool:
+    # RE2 has no backtracking, so a page full of "generator" can't make
+    # generator.*wordpress quadratic. Letter-escaped patterns stay on stdlib re.
+    return re2 is not None and not re.search(r"\\[A-Za-z]", pattern)
+
+# Per tech: (literal needles for `in` tests on lowercased content, stdlib
+# regexes for the lowercased content, RE2 regexes for its UTF-8 bytes).
+_SPLIT = {
+    category: {
+        tech_name: (
+            tuple(lit for p in patterns if (lit := _as_literal(p)) is not None),
+            tuple(
+                _compile_lower(p) for p in patterns
+                if _as_literal(p) is None and not _uses_re2(p)
+            ),
+            tuple(
+                re2.compile(p.lower().encode()) for p in patterns
+                if _as_literal(p) is None and _uses_re2(p)
+            ),
+        )
+        for tech_name, patterns in techs.items()
+    }
+    for category, techs in SIGNATURES.items()
+}
+
+def _build_automaton():
+    """One automaton over every literal needle, mapping it to its (category, tech) owners."""
+    if ahocorasick is None:
+        return None
+    owners: Dict[str, set] = {}
+    for category, techs in _SPLIT.items():
+        for tech_name, (literals, _, _) in techs.items():
+            for lit in literals:
+                owners.setdefault(lit, set()).add((category, tech_name))
+    automaton = ahocorasick.Automaton()
+    for lit, techs in owners.items():
+        automaton.add_word(lit, frozenset(techs))
+    automaton.make_automaton()
+    return automaton
+
+_AUTOMATON = _build_automaton()
+# Number of distinct techs with at least one literal needle.
+_LITERAL_TECHS = sum(bool(split[0]) for techs in _SPLIT.values() for split in techs.values())
+
+# Bytes mode (raw, undecoded bodies): literals as bytes for `in` tests on
+# ASCII-lowercased data, and regexes compiled as bytes. Case folding is
+# ASCII-only here, which covers every signature.
+_BYTES_SPLIT = {
+    category: {
+        tech_name: (
+            tuple(lit.encode() for lit in literals),
+            tuple(re.compile(r.pattern.encode(), r.flags & re.IGNORECASE) for r in regexes)
+            + byte_regexes,
+        )
+        for tech_name, (literals, regexes, byte_regexes) in techs.items()
+    }
+    for category, techs in _SPLIT.items()
+}
+
+# IGNORECASE matches these against ASCII i/s, but lower() doesn't map them
+# there; content containing any of them takes the all-regex path.
+_FOLD_ODDITIES = ("\u0130", "\u0131", "\u017f")
+
+# Results for recently seen pages (re-fetches, retries, pagination), keyed by
+# the page's length and str hash plus its headers, so the HTML itself isn't
+# kept alive. Oldest entries are evicted first.
+_CACHE_SIZE = 1024
+_CACHE: Dict[tuple, Dict[str, Tuple[str, ...]]] = {}
+_CACHE_LOCK = threading.Lock()
+
+def detect_tech_stack(
+    html: Union[str, bytes], headers: Dict[str, str] = None
+) -> Dict[str, Tuple[str, ...]]:
     """
     Analyzes HTML and Headers to return identified technologies.
-    Returns: {"CMS": ["WordPress"], "Analytics": ["GA4", "Hotjar"], ...}
+    `html` may be the raw response body (bytes), which is scanned without decoding.
+    Returns: {"CMS": ("WordPress",), "Analytics": ("GA4", "Hotjar"), ...}
     """
     if headers is None:
         headers = {}
+    if isinstance(html, (bytearray, memoryview)):
+        html = bytes(html)
+
+    key = (isinstance(html, bytes), len(html), hash(html), tuple(sorted(headers.items())))
+    with _CACHE_LOCK:
+        cached = _CACHE.get(key)
+    if cached is None:
+        cached = _detect(html, headers)
+        with _CACHE_LOCK:
+            if len(_CACHE) >= _CACHE_SIZE:
+                del _CACHE[next(iter(_CACHE))]
+            _CACHE[key] = cached
+    # Tuples are immutable, so a shallow copy is enough to protect the cache.
+    return dict(cached)
+
+def _header_text(headers: Dict[str, str]) -> str:
+    return "\n".join(f"{name}: {value}" for name, value in headers.items())
+
+def _detect_bytes(data: bytes, header_text: str) -> Dict[str, Tuple[str, ...]]:
+    texts = (data.lower(), header_text.encode("utf-8", "surrogatepass").lower())
+    return {
+        category: tuple(
+            tech_name
+            for tech_name, (literals, regexes) in techs.items()
+            if any(lit in text for text in texts for lit in literals)
+            or any(r.search(text) for text in texts for r in regexes)
+        )
+        for category, techs in _BYTES_SPLIT.items()
+    }
+
+def _detect(html: Union[str, bytes], headers: Dict[str, str]) -> Dict[str, Tuple[str, ...]]:
+    # Headers are matched as their own "name: value" lines rather than appended
+    # to the HTML: no copy of the page, and header signatures like
+    # "server: nginx" match the header itself instead of a dict repr.
+    header_text = _header_text(headers)
+    if isinstance(html, bytes):
+        return _detect_bytes(html, header_text)
+    texts = (html, header_text)
     
-    # Combine HTML and Headers for simple regex searching
-    # (Headers converted to string usually helps matching)
-    header_str = str(headers)
-    content = html + " " + header_str
-    
-    detected: Dict[str, List[str]] = {}
-    
-    for category, techs in SIGNATURES.items():
-        detected[category] = []
-        for tech_name, patterns in techs.items():
-            for pattern in patterns:
+    detected: Dict[str, Tuple[str, ...]] = {}
+
+    if any(c in text for text in texts for c in _FOLD_ODDITIES):
+        for category, techs in _COMPILED.items():
+            detected[category] = tuple(
+                tech_name
+                for tech_name, patterns in techs.items()
                 # Case insensitive search
-                if re.search(pattern, content, re.IGNORECASE):
-                    detected[category].append(tech_name)
-                    break # Found this tech, move to next
-                    
+                if any(pattern.search(text) for pattern in patterns for text in texts)
+            )
+        return detected
+
+    texts = tuple(text.lower() for text in texts)
+    literal_hits = None
+    if _AUTOMATON is not None:
+        # Every literal needle in one pass over each text, stopping early
+        # once every tech that has literals is already found.
+        literal_hits = set()
+        for text in texts:
+            for _, hits in _AUTOMATON.iter(text):
+                literal_hits |= hits
+                if len(literal_hits) == _LITERAL_TECHS:
+                    break
+    encoded = None
+    for category, techs in _SPLIT.items():
+        found = []
+        for tech_name, (literals, regexes, byte_regexes) in techs.items():
+            if literal_hits is not None:
+                hit = (category, tech_name) in literal_hits
+            else:
+                hit = any(lit in text for text in texts for lit in literals)
+            if not hit and regexes:
+                hit = any(r.search(text) for text in texts for r in regexes)
+            if not hit and byte_regexes:
+                if encoded is None:
+                    encoded = tuple(text.encode("utf-8", "surrogatepass") for text in texts)
+                hit = any(r.search(data) for data in encoded for r in byte_regexes)
+            if hit:
+                found.append(tech_name)
+        detected[category] = tuple(found)
+
     return detected
+
+# Longest literal needle minus one: the bytes carried between chunks so a
+# needle split across a chunk boundary is still seen.
+_OVERLAP = max(
+    (len(lit) for techs in _BYTES_SPLIT.values() for literals, _ in techs.values() for lit in literals),
+    default=1,
+) - 1
+
+class TechDetector:
+    """
+    Incremental detect_tech_stack for a body that arrives in chunks, so
+    detection finishes together with the download:
+
+        detector = TechDetector()
+        html, headers = fetch_html(url, on_chunk=detector.feed)
+        detector.result(headers)  # same as detect_tech_stack(body_bytes, headers)
+
+    Literals are checked per chunk (plus a small overlap). The regex signatures
+    never match across a newline, so they run once per completed line.
+    Headers are only known once the response arrives, so result() takes them.
+    """
+
+    def __init__(self):
+        self._found: set = set()
+        self._tail = b""
+        self._pending: List[bytes] = []
+
+    def feed(self, chunk: bytes) -> None:
+        if not chunk:
+            return
+        lowered = bytes(chunk).lower()
+        window = self._tail + lowered
+        self._tail = window[-_OVERLAP:] if _OVERLAP else b""
+        cut = lowered.rfind(b"\n")
+        if cut < 0:
+            self._pending.append(lowered)
+            self._scan(window, b"")
+            return
+        lines = b"".join(self._pending) + lowered[:cut + 1]
+        self._pending = [lowered[cut + 1:]]
+        self._scan(window, lines)
+
+    def _scan(self, window: bytes, lines: bytes) -> None:
+        for category, techs in _BYTES_SPLIT.items():
+            for tech_name, (literals, regexes) in techs.items():
+                key = (category, tech_name)
+                if key in self._found:
+                    continue
+                if any(lit in window for lit in literals) or (
+                    lines and any(r.search(lines) for r in regexes)
+                ):
+                    self._found.add(key)
+
+    def result(self, headers: Dict[str, str] = None) -> Dict[str, Tuple[str, ...]]:
+        # The last line has no newline to complete it.
+        self._scan(b"", b"".join(self._pending))
+        self._pending = []
+        header_hits = _detect_bytes(b"", _header_text(headers or {}))
+        return {
+            category: tuple(
+                tech_name
+                for tech_name in techs
+                if (category, tech_name) in self._found
+                or tech_name in header_hits[category]
+            )
+            for category, techs in _BYTES_SPLIT.items()
+        }
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import datetime as dt
+import sys
+from pathlib import Path
+
+import pytest
+from pypdf import PdfReader
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts" / "lib"))
+
+import _process_pool  # noqa: E402
+from decision_brief_pdf import (  # noqa: E402
+    generate_all_briefs,
+    generate_decision_brief_pdf,
+    generate_decision_briefs_batch,
+)
+
+TODAY = dt.date(2026, 1, 2)
+
+EXPECTED = {
+    ("en", "ok"): [
+        "Decision Brief",
+        "Client-safe",
+        "Domain:",
+        "https://example.com",
+        "Overall status",
+        "OK (Ready)",
+        "What this means",
+        "- The website is reachable and clear enough for decisions.",
+        "- Focus on quick wins to improve response and clarity.",
+        "Recommended decision",
+        "Proceed with sending this report and schedule a brief review call.",
+        "Campaign: Spring",
+        "Date: 2026-01-02",
+        "Deterministic Website Audit",
+    ],
+    ("ro", "issues"): [
+        "Decizie rapidă",
+        "Client-safe",
+        "Domeniu:",
+        "https://example.com",
+        "Status general",
+        "Probleme găsite",
+        "Ce înseamnă",
+        "- Există blocaje care reduc încrederea sau conversia.",
+        "- Rezolvați întâi problemele cu impact mare.",
+        "Decizie recomandată",
+        "Pauzați promovarea până la rezolvarea blocajelor, apoi re-rulați.",
+        "Campanie: Spring",
+        "Data: 02.01.2026",
+        "Deterministic Website Audit",
+    ],
+}
+
+
+@pytest.mark.parametrize("lang,mode", sorted(EXPECTED))
+def test_brief_is_one_page_with_expected_text(tmp_path: Path, lang: str, mode: str) -> None:
+    out = tmp_path / f"brief_{lang}.pdf"
+    audit = {"url": "https://example.com", "campaign": "Spring", "mode": mode}
+    generate_decision_brief_pdf(audit, lang, str(out), today=TODAY)
+
+    reader = PdfReader(str(out))
+    assert len(reader.pages) == 1
+    assert reader.pages[0].extract_text().splitlines() == EXPECTED[(lang, mode)]
+    assert reader.metadata.title == EXPECTED[(lang, mode)][0]
+
+
+def test_brief_overflow_flows_onto_next_page(tmp_path: Path) -> None:
+    out = tmp_path / "brief_long.pdf"
+    audit = {"url": "https://example.com", "campaign": "Campanie ș ț " * 120 + "END", "mode": "ok"}
+    generate_decision_brief_pdf(audit, "ro", str(out), today=TODAY)
+
+    reader = PdfReader(str(out))
+    assert len(reader.pages) == 2
+    text = "".join(page.extract_text() for page in reader.pages)
+    assert "END" in text
+    assert "Data: 02.01.2026" in text
+
+
+def test_generate_all_briefs_writes_every_language_and_format(tmp_path: Path) -> None:
+    audit = {"url": "https://example.com", "campaign": "Spring", "mode": "issues"}
+
+    paths = generate_all_briefs(audit, str(tmp_path))
+
+    names = ["Decision_Brief_RO.pdf", "Decision_Brief_RO.txt", "Decision_Brief_EN.pdf", "Decision_Brief_EN.txt"]
+    assert paths == [str(tmp_path / name) for name in names]
+    text = PdfReader(paths[0]).pages[0].extract_text()
+    assert "Probleme găsite" in text
+    assert (tmp_path / "Decision_Brief_EN.txt").read_text(encoding="utf-8").startswith("Decision Brief\n")
+
+
+def test_batch_propagates_worker_errors(tmp_path: Path) -> None:
+    audit = {"url": "https://example.com", "mode": "ok"}
+    items = [(audit, "en", str(tmp_path / "ok.pdf")), (audit, "en", str(tmp_path / "missing" / "x.pdf"))]
+
+    with pytest.raises(FileNotFoundError):
+        generate_decision_briefs_batch(items)
+
+
+def test_batch_runs_in_process_when_pool_cannot_start(monkeypatch, tmp_path: Path) -> None:
+    def no_processes(**_kwargs):
+        raise NotImplementedError
+
+    monkeypatch.setattr(_process_pool, "ProcessPoolExecutor", no_processes)
+    audit = {"url": "https://example.com", "mode": "ok"}
+    items = [(audit, lang, str(tmp_path / f"{lang}.pdf")) for lang in ("en", "ro")]
+
+    assert generate_decision_briefs_batch(items) == [item[2] for item in items]
+    assert all(Path(item[2]).stat().st_size > 0 for item in items)
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from pypdf import PdfReader
+
+
+def _write_verdict(run_dir: Path, evidence_summary: dict) -> None:
+    (run_dir / "audit").mkdir(parents=True, exist_ok=True)
+    (run_dir / "audit" / "verdict.json").write_text(
+        json.dumps(
+            {
+                "url_input": "https://example.com",
+                "final_url": "https://example.com",
+                "timestamp_utc": "2026-02-04T00:00:00Z",
+                "lang": "EN",
+                "verdict": "GO_WITH_FIXES",
+                "categories": {
+                    "conversion_tracking": {"status": "FAIL", "evidence": {"pixel": "missing"}},
+                    "landing": {"status": "PASS", "evidence": {"code": 200}},
+                },
+                "evidence_summary": evidence_summary,
+            },
+            indent=2,
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+
+
+def _run(run_dir: Path, *extra: str) -> subprocess.CompletedProcess:
+    repo_root = Path(__file__).resolve().parents[1]
+    return subprocess.run(
+        [sys.executable, str(repo_root / "scripts" / "generate_report_from_verdict.py"), str(run_dir), *extra],
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_generate_report_writes_both_pdfs(tmp_path: Path) -> None:
+    run_dir = tmp_path / "run"
+    _write_verdict(run_dir, {"http_status": 200})
+
+    result = _run(run_dir)
+    assert result.returncode == 0, result.stdout + result.stderr
+
+    deliverables = run_dir / "deliverables"
+    brief = PdfReader(str(deliverables / "Decision_Brief_EN.pdf"))
+    assert "VERDICT: GO_WITH_FIXES" in brief.pages[0].extract_text()
+
+    appendix = PdfReader(str(deliverables / "Evidence_Appendix_EN.pdf"))
+    assert len(appendix.pages) == 6
+    text = "\n".join(page.extract_text() for page in appendix.pages)
+    assert "conversion_tracking: pixel = missing" in text
+    assert "http_status: 200" in text
+
+
+def test_evidence_appendix_paginates_long_sections(tmp_path: Path) -> None:
+    run_dir = tmp_path / "run"
+    _write_verdict(run_dir, {f"key_{i:03d}": "value " * 30 for i in range(200)})
+
+    result = _run(run_dir)
+    assert result.returncode == 0, result.stdout + result.stderr
+
+    appendix = PdfReader(str(run_dir / "deliverables" / "Evidence_Appendix_EN.pdf"))
+    assert len(appendix.pages) > 6
+    text = "\n".join(page.extract_text() for page in appendix.pages)
+    assert "key_199" in text
+
+
+def test_stub_backend_writes_single_page_pdfs(tmp_path: Path) -> None:
+    run_dir = tmp_path / "run"
+    _write_verdict(run_dir, {"http_status": 200})
+
+    result = _run(run_dir, "--backend", "stub")
+    assert result.returncode == 0, result.stdout + result.stderr
+
+    titles = {"Decision_Brief_EN.pdf": "SCOPE Decision Brief", "Evidence_Appendix_EN.pdf": "SCOPE Evidence Appendix"}
+    for name, title in titles.items():
+        reader = PdfReader(str(run_dir / "deliverables" / name))
+        assert len(reader.pages) == 1
+        assert reader.pages[0].extract_text().splitlines() == [
+            title,
+            "Verdict: GO_WITH_FIXES",
+            "Domain: https://example.com",
+            "Date (UTC): 2026-02-04T00:00:00Z",
+            "Full report rendering skipped; see deliverables/verdict.json.",
+        ]
+
+
+def test_stub_pdfium_writer_keeps_winansi_text(tmp_path: Path) -> None:
+    pytest.importorskip("pypdfium2")
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+    import generate_report_from_verdict as generator
+
+    out = tmp_path / "stub.pdf"
+    generator._write_stub_pdf_pdfium(out, "Café Decision Brief", ["Verdict: GO", "Cost: 5 €"])
+
+    reader = PdfReader(str(out))
+    assert len(reader.pages) == 1
+    assert reader.pages[0].extract_text().splitlines() == ["Café Decision Brief", "Verdict: GO", "Cost: 5 €"]
+
+
+def test_stub_backend_keeps_non_winansi_text_on_reportlab(tmp_path: Path) -> None:
+    run_dir = tmp_path / "run"
+    _write_verdict(run_dir, {"http_status": 200})
+    verdict_path = run_dir / "audit" / "verdict.json"
+    data = json.loads(verdict_path.read_text(encoding="utf-8"))
+    data["brand"] = "Preț"
+    verdict_path.write_text(json.dumps(data), encoding="utf-8")
+
+    result = _run(run_dir, "--backend", "stub")
+    assert result.returncode == 0, result.stdout + result.stderr
+
+    # Only the ReportLab canvas sets /Title; PDFium would garble the "ț".
+    reader = PdfReader(str(run_dir / "deliverables" / "Decision_Brief_EN.pdf"))
+    assert reader.metadata.title == "Preț Decision Brief"
+
+
+def test_unchanged_verdict_skips_rebuild(tmp_path: Path) -> None:
+    run_dir = tmp_path / "run"
+    _write_verdict(run_dir, {"http_status": 200})
+    assert _run(run_dir).returncode == 0
+    brief = run_dir / "deliverables" / "Decision_Brief_EN.pdf"
+    first_mtime = brief.stat().st_mtime_ns
+
+    result = _run(run_dir)
+    assert result.returncode == 0
+    assert "OK deliverables (cached)" in result.stdout
+    assert brief.stat().st_mtime_ns == first_mtime
+
+    # deliverables/verdict.json takes priority over audit/verdict.json.
+    verdict_path = run_dir / "deliverables" / "verdict.json"
+    data = json.loads(verdict_path.read_text(encoding="utf-8"))
+    data["evidence_summary"] = {"http_status": 404}
+    verdict_path.write_text(json.dumps(data), encoding="utf-8")
+    result = _run(run_dir)
+    assert result.returncode == 0
+    assert "(cached)" not in result.stdout
+
+    result = _run(run_dir, "--force")
+    assert "(cached)" not in result.stdout
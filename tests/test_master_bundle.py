@@ -237,3 +237,36 @@ def test_verify_client_safe_zip_allowlist(tmp_path: Path) -> None:
         text=True,
     )
     assert result.returncode != 0
+
+
+def test_verify_client_safe_zip_flags_leaked_notes(tmp_path: Path) -> None:
+    names = [
+        "audit/report.pdf",
+        "action_scope/action_scope.pdf",
+        "proof_pack/proof_pack.pdf",
+        "regression/regression.pdf",
+        "deliverables/Decision_Brief_EN.pdf",
+        "deliverables/Evidence_Appendix_EN.pdf",
+        "final/master.pdf",
+        "final/MASTER_BUNDLE.pdf",
+    ]
+    script = Path(__file__).resolve().parents[1] / "scripts" / "verify_client_safe_zip.py"
+
+    def verify(verdict: str) -> subprocess.CompletedProcess:
+        zip_path = tmp_path / "client_safe_bundle.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            for name in names:
+                zf.writestr(name, b"%PDF-1.4\n")
+            zf.writestr("deliverables/verdict.json", verdict)
+        return subprocess.run(
+            [sys.executable, str(script), str(zip_path)],
+            capture_output=True,
+            text=True,
+        )
+
+    assert verify('{"verdict": "GO"}').returncode == 0
+    result = verify('{"notes": "internal", "city": "Brașov"}')
+    assert result.returncode != 0
+    assert "leaked notes in: deliverables/verdict.json" in result.stdout
+    result = verify('{"path": "/home/ops/run"}')
+    assert "leaked path in" in result.stdout
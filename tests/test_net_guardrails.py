@@ -7,7 +7,8 @@ import os
 # Add parent directory to path to import net_guardrails
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from net_guardrails import validate_url
+import net_guardrails
+from net_guardrails import cache_robots, get_cached_robots, parse_robots, robots_disallows, validate_url
 
 class TestNetGuardrails(unittest.TestCase):
     def test_valid_urls(self):
@@ -64,5 +65,38 @@ class TestNetGuardrails(unittest.TestCase):
                 validate_url("https://nonexistent-domain.example")
             self.assertIn("DNS resolution failed", str(cm.exception))
 
+
+class TestRobotsRules(unittest.TestCase):
+    def test_first_listed_rule_is_reported(self):
+        rules = parse_robots("User-agent: *\nDisallow: /shop/cart\nDisallow: /shop\n")
+        self.assertEqual(robots_disallows("https://example.com/shop/cart/1", rules), (True, "/shop/cart"))
+        self.assertEqual(robots_disallows("https://example.com/shop/list", rules), (True, "/shop"))
+        self.assertEqual(robots_disallows("https://example.com/about", rules), (False, None))
+
+    def test_plain_dict_rules(self):
+        rules = {"*": ["", "/private"], "scope": ["/"]}
+        self.assertEqual(robots_disallows("https://example.com/private/x", rules), (True, "/private"))
+        self.assertEqual(robots_disallows("https://example.com/public", rules), (True, "/"))
+
+    def test_grouped_user_agents_share_rules(self):
+        rules = parse_robots("User-agent: other\nUser-agent: scope\nDisallow: /secret\n")
+        self.assertEqual(rules["other"], ["/secret"])
+        self.assertEqual(robots_disallows("https://example.com/secret/page", rules), (True, "/secret"))
+
+    def test_verdicts_memoized_per_rules_object(self):
+        rules = parse_robots("User-agent: *\nDisallow: /private\n")
+        robots_disallows("https://example.com/private/a", rules)
+        self.assertEqual(rules._verdicts["/private/a"], (True, "/private"))
+
+    def test_site_cache_expires_after_ttl(self):
+        rules = parse_robots("User-agent: *\nDisallow: /private\n")
+        with patch("net_guardrails.time.monotonic", return_value=1000.0):
+            cache_robots("https://example.com", rules)
+            self.assertIs(get_cached_robots("https://example.com"), rules)
+        expired = 1000.0 + net_guardrails.ROBOTS_CACHE_TTL
+        with patch("net_guardrails.time.monotonic", return_value=expired):
+            self.assertIsNone(get_cached_robots("https://example.com"))
+
+
 if __name__ == '__main__':
     unittest.main()
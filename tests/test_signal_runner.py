@@ -0,0 +1,90 @@
+import share_meta
+import signal_detector
+import social_signals
+from signal_runner import run_signals
+
+HTML = """
+<html><head>
+  <link rel="canonical" href="https://example.com/">
+  <meta property="og:title" content="Salon">
+  <meta property="og:title" content="Salon again">
+  <meta name="twitter:card" content="summary">
+</head><body>
+  <a href="https://instagram.com/salon">Instagram</a>
+  <a href="https://facebook.com/sharer.php?u=x">Share</a>
+  <a href="https://wa.me/123">Contact us</a>
+  <button>Book now</button>
+  <p>Prices from 50 lei</p>
+</body></html>
+"""
+
+
+def test_run_signals_matches_individual_extractors() -> None:
+    result = run_signals(HTML, page_url="https://example.com/")
+
+    assert result["share_meta"] == share_meta.extract_share_meta(HTML, page_url="https://example.com/")
+    assert result["social"] == social_signals.extract_social_signals(HTML)
+    assert result["page"] == signal_detector.detect_page_signals(HTML)
+    assert result["social"]["instagram_urls"] == ["https://instagram.com/salon"]
+    assert result["social"]["facebook_linked"] is False
+
+
+def test_build_all_signals_uses_one_parse_with_same_results(monkeypatch) -> None:
+    import audit
+
+    parses = []
+    real_as_soup = audit.as_soup
+    monkeypatch.setattr(audit, "as_soup", lambda html: parses.append(html) or real_as_soup(html))
+
+    combined = audit.build_all_signals(HTML, page_url="https://example.com/")
+
+    assert parses == [HTML]
+    assert combined["share_meta"] == share_meta.extract_share_meta(HTML, page_url="https://example.com/")
+    social = social_signals.extract_social_signals(HTML)
+    assert {key: combined[key] for key in social} == social
+    assert combined["booking_detected"] is True
+
+
+def test_social_signals_match_for_string_and_soup_with_template() -> None:
+    from _html_utils import as_soup
+
+    html = '<body><template><a href="https://facebook.com/x">FB</a></template><a href="https://wa.me/1">WA</a></body>'
+    from_str = social_signals.extract_social_signals(html)
+    assert from_str == social_signals.extract_social_signals(as_soup(html))
+    assert from_str["facebook_linked"] is True
+    assert run_signals(html)["social"] == from_str
+
+
+def test_share_image_checks_are_cached_per_run_only(monkeypatch) -> None:
+    calls = []
+
+    def fake_head_status(url, timeout=None):
+        calls.append(url)
+        return {"ok": False, "error": "timeout"}
+
+    monkeypatch.setattr(share_meta, "_head_status", fake_head_status)
+    html = '<head><meta property="og:image" content="https://example.com/og.png"></head>'
+
+    run_cache: dict = {}
+    first = share_meta.extract_share_meta(html, head_cache=run_cache)
+    first["og_image_check"]["error"] = "mutated"
+    second = share_meta.extract_share_meta(html, head_cache=run_cache)
+    assert calls == ["https://example.com/og.png"]
+    assert second["og_image_check"] == {"ok": False, "error": "timeout"}
+
+    # A new run (or no cache) checks again instead of reusing the failure.
+    share_meta.extract_share_meta(html)
+    share_meta.extract_share_meta(html, head_cache={})
+    assert len(calls) == 3
+
+
+def test_keyword_precheck_agrees_with_each_pattern() -> None:
+    import re
+
+    for words in signal_detector.KEYWORDS.values():
+        for word in words:
+            text = f"x {word} y"
+            result = signal_detector.detect_page_signals(f"<p>{text}</p>")
+            for key, pattern in signal_detector.PATTERNS.items():
+                expected = bool(re.search(pattern, text, re.IGNORECASE))
+                assert result[f"{key}_detected"] is expected, (key, word)
@@ -0,0 +1,73 @@
+from net_guardrails import read_limited_text
+from tech_detective import TechDetector, detect_tech_stack
+
+
+def test_headers_are_matched_as_name_value_lines() -> None:
+    stack = detect_tech_stack(
+        '<script src="/wp-content/app.js"></script>',
+        {"Server": "nginx/1.24", "X-Wix-Request-Id": "abc"},
+    )
+
+    assert stack["CMS"] == ("WordPress", "Wix")
+    assert stack["Infrastructure"] == ("Nginx",)
+
+
+def test_signatures_match_case_insensitively() -> None:
+    stack = detect_tech_stack('<meta name="GENERATOR" content="Joomla!"> GTM-ABC123', {})
+
+    assert stack["CMS"] == ("Joomla",)
+    assert stack["Analytics"] == ("Google Tag Manager",)
+    assert stack["Libraries"] == ()
+
+
+def test_raw_bytes_body_matches_decoded_text() -> None:
+    html = '<link href="https://cdn.Shopify.com/s.css"><script>fbq(\'init\', 1)</script>'
+
+    assert detect_tech_stack(html.encode(), {"CF-RAY": "1"}) == detect_tech_stack(html, {"CF-RAY": "1"})
+
+
+class _StreamResp:
+    headers = {"Server": "cloudflare"}
+    encoding = "utf-8"
+
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    def iter_content(self, chunk_size=16384):
+        for i in range(0, len(self._body), 7):
+            yield self._body[i:i + 7]
+
+
+def test_tech_detector_streams_chunks_during_read() -> None:
+    body = b'<meta name="generator" content="WordPress">\n<script src="https://widget.intercom.io/w.js">'
+    detector = TechDetector()
+
+    text, too_large = read_limited_text(_StreamResp(body), None, on_chunk=detector.feed)
+
+    assert not too_large and text == body.decode()
+    assert detector.result(_StreamResp.headers) == detect_tech_stack(body, _StreamResp.headers)
+    assert detector.result(_StreamResp.headers)["Marketing"] == ("Intercom",)
+
+
+def test_fetch_html_feeds_detector_for_build_all_signals(monkeypatch) -> None:
+    import audit
+
+    body = b'<script src="https://cdn.shopify.com/s.js"></script>\n<div data-reactroot></div>'
+
+    class _Resp(_StreamResp):
+        def raise_for_status(self) -> None:
+            pass
+
+    class _Session:
+        def get(self, url, **kwargs):
+            return _Resp(body)
+
+    monkeypatch.setattr(audit, "safe_session", _Session)
+    monkeypatch.setattr(audit, "_robots_allows_url", lambda url: True)
+
+    detector = TechDetector()
+    html, headers = audit.fetch_html("https://example.com", on_chunk=detector.feed)
+    signals = audit.build_all_signals(html, headers=headers, tech_stack=detector.result(headers))
+
+    assert signals["tech_stack"] == detect_tech_stack(html, headers)
+    assert signals["tech_stack"]["CMS"] == ("Shopify",)
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import visual_engine
+
+
+def test_pool_capture_many_preserves_job_order(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(visual_engine, "PLAYWRIGHT_AVAILABLE", False)
+
+    def fake_capture(self, url, output_path, device_type="desktop", timeout_ms=20000):
+        return {"ok": True, "path": str(output_path), "device": device_type, "url": url}
+
+    monkeypatch.setattr(visual_engine.VisualVerifier, "capture", fake_capture)
+
+    jobs = [(f"https://example.com/{i}", tmp_path / f"{i}.png", "mobile" if i % 2 else "desktop") for i in range(7)]
+    with visual_engine.VisualVerifierPool(size=3) as pool:
+        results = pool.capture_many(jobs)
+        assert pool.capture_many([]) == []
+
+    assert [r["url"] for r in results] == [url for url, _, _ in jobs]
+    assert [r["device"] for r in results] == [device for _, _, device in jobs]
+
+
+def test_pool_reports_unavailable_browser(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(visual_engine, "PLAYWRIGHT_AVAILABLE", False)
+    with visual_engine.VisualVerifierPool(size=1) as pool:
+        (res,) = pool.capture_many([("https://example.com", tmp_path / "a.png", "desktop")])
+    assert res["ok"] is False
+    assert res["error"] == "playwright_not_installed_or_initialized"
+
+
+def test_route_filter_blocks_resource_types_and_analytics_hosts() -> None:
+    class FakeRoute:
+        def __init__(self, resource_type: str, url: str) -> None:
+            self.request = type("Request", (), {"resource_type": resource_type, "url": url})()
+            self.outcome = None
+
+        def abort(self) -> None:
+            self.outcome = "abort"
+
+        def continue_(self) -> None:
+            self.outcome = "continue"
+
+    handler = visual_engine._route_filter(frozenset({"image", "analytics"}))
+    cases = {
+        ("image", "https://example.com/hero.jpg"): "abort",
+        ("script", "https://www.googletagmanager.com/gtm.js"): "abort",
+        ("script", "https://example.com/app.js"): "continue",
+        ("script", "https://notdoubleclick.net/a.js"): "continue",
+    }
+    for (resource_type, url), expected in cases.items():
+        route = FakeRoute(resource_type, url)
+        handler(route)
+        assert route.outcome == expected, url
+
+
+def test_pages_are_reused_per_origin(monkeypatch) -> None:
+    class FakePage:
+        def __init__(self) -> None:
+            self.closed = False
+            self.evaluated = []
+
+        def is_closed(self) -> bool:
+            return self.closed
+
+        def close(self) -> None:
+            self.closed = True
+
+        def evaluate(self, script):
+            self.evaluated.append(script)
+
+    class FakeContext:
+        def new_page(self) -> FakePage:
+            return FakePage()
+
+    vv = visual_engine.VisualVerifier()
+    monkeypatch.setattr(vv, "_context", lambda *args: FakeContext())
+
+    first = vv._page("https://example.com/", "desktop", frozenset(), "light")
+    again = vv._page("https://example.com/pricing", "desktop", frozenset(), "light")
+    assert again is first
+    assert first.evaluated  # timings cleared before reuse
+
+    mobile = vv._page("https://example.com/", "mobile", frozenset(), "light")
+    assert mobile is not first
+
+    other = vv._page("https://other.example/", "desktop", frozenset(), "light")
+    assert other is not first
+    assert first.closed
+
+    vv._drop_page(other)
+    assert other.closed
+    assert vv._page("https://other.example/", "desktop", frozenset(), "light") is not other
@@ -18,3 +18,14 @@ def test_score_gauge_zero_arc_does_not_crash(tmp_path: Path) -> None:
     assert pdf_path.exists()
     assert pdf_path.stat().st_size > 0
 
+
+def test_score_gauge_has_single_definition() -> None:
+    import inspect
+
+    import ui
+    import ui.widgets
+
+    assert ui.ScoreGauge is ui.widgets.ScoreGauge
+    source = Path(inspect.getsourcefile(ScoreGauge)).resolve()
+    assert source == Path(ui.widgets.__file__).resolve()
+    assert source.parent.name == "ui"
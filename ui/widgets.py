@@ -2,14 +2,70 @@
 widgets.py - Custom visual elements for reports.
 """
 
+from functools import lru_cache
 from reportlab.platypus import Flowable, Table, TableStyle
 import math
 
 from reportlab.lib import colors
+from reportlab.graphics import renderPDF
 from reportlab.graphics.shapes import Drawing, Circle, String, Wedge
 from reportlab.lib.units import mm
 from .theme import Theme
 
+def _faded(c):
+    # Handle HexColor to Color conversion for fading
+    return colors.Color(c.red, c.green, c.blue, alpha=0.15)
+
+# (threshold, color, faded color) bands, highest first; scores above a
+# threshold take its colors. Theme colors are constants, so the faded
+# variants are built once at import.
+_SCORE_BANDS = (
+    (80, Theme.SUCCESS, _faded(Theme.SUCCESS)),
+    (50, Theme.WARNING, _faded(Theme.WARNING)),
+)
+_LOW_BAND = (Theme.ERROR, _faded(Theme.ERROR))
+
+@lru_cache(maxsize=512)
+def _gauge_drawing(score_value: float, size: float, label: str) -> Drawing:
+    """
+    Builds the gauge for a clamped score as a Drawing of shape primitives.
+    Cached and shared between gauges, so callers must not mutate it.
+    """
+    # Determine Color
+    c, bg_color = _LOW_BAND
+    for threshold, band, faded in _SCORE_BANDS:
+        if score_value > threshold:
+            c, bg_color = band, faded
+            break
+
+    cx, cy = size, size
+    r_outer = size
+    r_inner = size * 0.85
+    d = Drawing(size * 2, size * 2)
+
+    # Background Circle (Light)
+    d.add(Circle(cx, cy, r_outer, fillColor=bg_color, strokeColor=None))
+
+    # Segment (Arc)
+    # 360 degrees. Start at 90 (top), running clockwise.
+    # We want to emulate a stroke, so we draw a wedge then a white circle inside
+    angle = 3.6 * score_value
+    if score_value >= 99.999:
+        # A full ring is a plain circle; a 360 degree wedge is a long polygon.
+        d.add(Circle(cx, cy, r_outer, fillColor=c, strokeColor=None))
+    elif angle > 0.001:
+        d.add(Wedge(cx, cy, r_outer, 90 - angle, 90, fillColor=c, strokeColor=None))
+
+    # Inner White Circle (Donut)
+    d.add(Circle(cx, cy, r_inner, fillColor=colors.white, strokeColor=None))
+
+    # Text
+    d.add(String(cx, cy - (size*0.1), str(int(round(score_value))), textAnchor="middle",
+                 fontName="DejaVuSans-Bold", fontSize=size * 0.5, fillColor=Theme.PRIMARY))
+    d.add(String(cx, cy - (size*0.4), label, textAnchor="middle",
+                 fontName="DejaVuSans", fontSize=size * 0.2, fillColor=Theme.TEXT_LIGHT))
+    return d
+
 class ScoreGauge(Flowable):
     """
     Draws a circular score gauge.
@@ -22,80 +78,38 @@ class ScoreGauge(Flowable):
         self.width = size * 2
         self.height = size * 2
 
-    def draw(self):
-        score_value = 0.0
         try:
-            score_value = float(self.score)
+            score_value = float(score)
         except (TypeError, ValueError):
             score_value = 0.0
-
         if not math.isfinite(score_value):
             score_value = 0.0
-
         score_value = max(0.0, min(100.0, score_value))
-        display_score = int(round(score_value))
+        # Built once (and shared across identical gauges); ReportLab may call
+        # draw() more than once per flowable.
+        self._drawing = _gauge_drawing(score_value, size, label) if size > 0 else None
+
+    def draw(self):
+        if self._drawing is None:
+            return
+        renderPDF.draw(self._drawing, self.canv, 0, 0)
 
-        # Determine Color
-        c = Theme.ERROR
-        if score_value > 50:
-            c = Theme.WARNING
-        if score_value > 80:
-            c = Theme.SUCCESS
-        
-        cx, cy = self.size, self.size
-        r_outer = self.size
-        r_inner = self.size * 0.85
-        
-        # Background Circle (Light)
-        # Handle HexColor to Color conversion for fading
-        bg_color = colors.Color(c.red, c.green, c.blue, alpha=0.15)
-        self.canv.setFillColor(bg_color)
-        self.canv.circle(cx, cy, r_outer, stroke=0, fill=1)
-        
-        # Segment (Arc)
-        # 360 degrees. Start at 90 (top).
-        # ReportLab Wedge: (cx, cy, radius, startAng, extent)
-        angle = 3.6 * score_value
-        draw_arc = angle > 0.001
-        
-        # We want to emulate a stroke, so we draw a wedge then a white circle inside
-        if draw_arc:
-            self.canv.setFillColor(c)
-            self.canv.saveState()
-            p = self.canv.beginPath()
-            p.moveTo(cx, cy)
-            p.arc(cx-r_outer, cy-r_outer, cx+r_outer, cy+r_outer, 90, -angle) # Negative creates clockwise
-            p.lineTo(cx, cy)
-            p.close()
-            self.canv.drawPath(p, fill=1, stroke=0)
-            self.canv.restoreState()
-        
-        # Inner White Circle (Donut)
-        self.canv.setFillColor(colors.white)
-        self.canv.circle(cx, cy, r_inner, stroke=0, fill=1)
-        
-        # Text
-        self.canv.setFillColor(Theme.PRIMARY)
-        self.canv.setFont("DejaVuSans-Bold", self.size * 0.5)
-        self.canv.drawCentredString(cx, cy - (self.size*0.1), str(display_score))
-        
-        self.canv.setFillColor(Theme.TEXT_LIGHT)
-        self.canv.setFont("DejaVuSans", self.size * 0.2)
-        self.canv.drawCentredString(cx, cy - (self.size*0.4), self.label)
+# Shared by every card; Table.setStyle only reads the style's commands.
+_CARD_STYLE = TableStyle([
+    ('BACKGROUND', (0,0), (-1,-1), colors.white),
+    ('FONTNAME', (0,0), (-1,0), 'DejaVuSans-Bold'), # Header
+    ('TEXTCOLOR', (0,0), (-1,0), Theme.PRIMARY),
+    ('BOTTOMPADDING', (0,0), (-1,-1), 8),
+    ('TOPPADDING', (0,0), (-1,-1), 8),
+    ('GRID', (0,0), (-1,-1), 0.5, Theme.BORDER),
+    ('ALIGN', (0,0), (-1,-1), 'LEFT'),
+    ('VALIGN', (0,0), (-1,-1), 'TOP'),
+])
 
 def create_card_table(data, col_widths=None):
     """
     Returns a Table formatted like a generic UI card.
     """
     t = Table(data, colWidths=col_widths)
-    t.setStyle(TableStyle([
-        ('BACKGROUND', (0,0), (-1,-1), colors.white),
-        ('FONTNAME', (0,0), (-1,0), 'DejaVuSans-Bold'), # Header
-        ('TEXTCOLOR', (0,0), (-1,0), Theme.PRIMARY),
-        ('BOTTOMPADDING', (0,0), (-1,-1), 8),
-        ('TOPPADDING', (0,0), (-1,-1), 8),
-        ('GRID', (0,0), (-1,-1), 0.5, Theme.BORDER),
-        ('ALIGN', (0,0), (-1,-1), 'LEFT'),
-        ('VALIGN', (0,0), (-1,-1), 'TOP'),
-    ]))
+    t.setStyle(_CARD_STYLE)
     return t
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-import json
 import os
 from pathlib import Path
 from typing import Optional, Literal
@@ -90,6 +89,7 @@ class VisualVerifier:
                 user_agent=user_agent,
                 locale="en-US",
                 timezone_id="UTC",
+                color_scheme="light",
             )
             
             page = context.new_page()
@@ -101,16 +101,15 @@ class VisualVerifier:
             
             # Metrics
             try:
-                perf_entry = page.evaluate("() => JSON.stringify(performance.getEntriesByType('navigation')[0])")
-                paint_entry = page.evaluate("() => JSON.stringify(performance.getEntriesByType('paint'))")
+                # Playwright serializes the entries itself; no JSON round trip.
+                pdata = page.evaluate("() => performance.getEntriesByType('navigation')[0]?.toJSON() || null")
+                paints = page.evaluate("() => performance.getEntriesByType('paint').map((e) => e.toJSON())")
                 
-                if perf_entry:
-                    pdata = json.loads(perf_entry)
+                if pdata:
                     if pdata.get("loadEventEnd") and pdata.get("startTime") is not None:
                         metrics["load_time_ms"] = int(pdata["loadEventEnd"])
                 
-                if paint_entry:
-                    paints = json.loads(paint_entry)
+                if paints:
                     for pt in paints:
                         if pt.get("name") == "first-contentful-paint":
                              metrics["fcp_ms"] = int(pt.get("startTime", 0))
@@ -127,7 +126,6 @@ class VisualVerifier:
             except Exception:
                 pass
 
-            page.emulate_media(color_scheme="light")
             page.screenshot(path=str(output_path), full_page=False)
             context.close()  # Close context but keep browser
             
@@ -4,17 +4,24 @@ visual_engine.py - Reusable Playwright Visual Verifier.
 Usage:
     with VisualVerifier() as vv:
         res = vv.capture("https://example.com", Path("out.png"))
+
+    with VisualVerifierPool(size=2) as pool:
+        results = pool.capture_many([(url, Path("a.png"), "desktop"), ...])
 """
 
 from __future__ import annotations
 
+import base64
 import logging
-import json
+import os
+import queue
+import threading
 from pathlib import Path
 from typing import Optional, Literal
+from urllib.parse import urlsplit
 
 try:
-    from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout, Browser, Playwright, BrowserContext
+    from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout, Browser, Playwright, BrowserContext, Page
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
@@ -23,53 +30,237 @@ except ImportError:
     Browser = object
     Playwright = object
     BrowserContext = object
+    Page = object
 
 logger = logging.getLogger("visual_engine")
 
 try:
-    from web_vitals import measure_vitals
+    from web_vitals import COMBINED_METRICS_SNIPPET, VITALS_INSTALL_SNIPPET, VITALS_START
 except Exception:
-    measure_vitals = None
+    COMBINED_METRICS_SNIPPET = None
+    VITALS_INSTALL_SNIPPET = None
+    VITALS_START = None
+
+# Device Profiles
+_DEVICE_PROFILES = {
+    # iPhone 13/14 Pro-ish
+    "mobile": {
+        "viewport": {"width": 390, "height": 844},
+        "device_scale_factor": 3,
+        "is_mobile": True,
+        "has_touch": True,
+        "user_agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 16_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.6 Mobile/15E148 Safari/604.1",
+    },
+    # Standard Desktop
+    "desktop": {
+        "viewport": {"width": 1280, "height": 720},
+        "device_scale_factor": 1,
+        "is_mobile": False,
+        "has_touch": False,
+        "user_agent": "VisualVerifier/1.0 (Desktop; +bot)",
+    },
+}
+
+# Extra wait for network idle after the load event.
+IDLE_TIMEOUT_MS = 3000
+
+# Encoder quality for .jpg/.jpeg outputs; JPEG encodes far faster than PNG.
+JPEG_QUALITY = 80
+
+# Hosts aborted when a capture blocks "analytics"; subdomains match too.
+ANALYTICS_HOSTS = frozenset({
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googleadservices.com",
+    "facebook.net",
+    "hotjar.com",
+    "clarity.ms",
+    "segment.com",
+    "segment.io",
+    "mixpanel.com",
+    "analytics.tiktok.com",
+    "snap.licdn.com",
+    "px.ads.linkedin.com",
+})
+
+
+def _is_analytics_host(url: str) -> bool:
+    host = urlsplit(url).hostname or ""
+    while host:
+        if host in ANALYTICS_HOSTS:
+            return True
+        _, _, host = host.partition(".")
+    return False
+
+
+def _route_filter(block: frozenset[str]):
+    """Route handler aborting the blocked resource types (and analytics hosts)."""
+    types = block - {"analytics"}
+    analytics = "analytics" in block
+
+    def handler(route) -> None:
+        request = route.request
+        if request.resource_type in types or (analytics and _is_analytics_host(request.url)):
+            route.abort()
+        else:
+            route.continue_()
+
+    return handler
+
+_LAUNCH_ARGS = [
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--font-render-hinting=none",
+]
 
 class VisualVerifier:
-    def __init__(self, headless: bool = True):
+    """
+    With `cache_dir`, every context is a persistent Chromium profile under
+    cache_dir/<device>[-<blocked>][-<color scheme>], so the HTTP cache and service workers
+    survive across audits. Profiles are per device because the user agent
+    and viewport differ, and a profile directory can only be open in one
+    browser at a time.
+    """
+
+    def __init__(self, headless: bool = True, cache_dir: Optional[str | Path] = None):
         self._playwright: Optional[Playwright] = None
         self._browser: Optional[Browser] = None
         self._headless = headless
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        # One long-lived context per (device profile, blocked resources,
+        # color scheme); captures only open pages.
+        self._contexts: dict[tuple[str, frozenset[str], str], BrowserContext] = {}
+        # Per context, the page of the last capture and its origin; reused
+        # while captures stay on that origin so the renderer stays warm.
+        self._pages: dict[tuple[str, frozenset[str], str], tuple[tuple[str, str], Page]] = {}
 
     def __enter__(self) -> "VisualVerifier":
         if PLAYWRIGHT_AVAILABLE:
             self._playwright = sync_playwright().start()
-            self._browser = self._playwright.chromium.launch(
-                headless=self._headless,
-                args=[
-                    "--no-sandbox",
-                    "--disable-setuid-sandbox",
-                    "--disable-dev-shm-usage",
-                    "--disable-gpu",
-                    "--font-render-hinting=none",
-                ]
-            )
+            # Persistent profiles launch their own browser per context.
+            if self._cache_dir is None:
+                self._browser = self._playwright.chromium.launch(
+                    headless=self._headless,
+                    args=_LAUNCH_ARGS,
+                )
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        self._pages.clear()  # closed with their contexts
+        for context in self._contexts.values():
+            try:
+                context.close()
+            except Exception:
+                pass
+        self._contexts.clear()
         if self._browser:
             self._browser.close()
         if self._playwright:
             self._playwright.stop()
 
+    def _context(
+        self,
+        device_type: str,
+        block: frozenset[str] = frozenset(),
+        color_scheme: str = "light",
+    ) -> BrowserContext:
+        """The shared context for a device profile, block set and color scheme, created on first use."""
+        key = "mobile" if device_type == "mobile" else "desktop"
+        context = self._contexts.get((key, block, color_scheme))
+        if context is None:
+            # Emulating the color scheme up front lets pages render with it
+            # first time, instead of re-laying out after emulate_media.
+            options = dict(
+                _DEVICE_PROFILES[key],
+                locale="en-US",
+                timezone_id="UTC",
+                color_scheme=color_scheme,
+            )
+            if self._cache_dir is not None:
+                parts = [key, *sorted(block)]
+                if color_scheme != "light":
+                    parts.append(color_scheme)
+                profile_dir = self._cache_dir / "-".join(parts)
+                context = self._playwright.chromium.launch_persistent_context(
+                    str(profile_dir),
+                    headless=self._headless,
+                    args=_LAUNCH_ARGS,
+                    **options,
+                )
+            else:
+                context = self._browser.new_context(**options)
+            if VITALS_INSTALL_SNIPPET:
+                context.add_init_script(VITALS_INSTALL_SNIPPET)
+            if block:
+                context.route("**/*", _route_filter(block))
+            self._contexts[(key, block, color_scheme)] = context
+        return context
+
+    def _page(self, url: str, device_type: str, block: frozenset[str], color_scheme: str) -> Page:
+        """A page in the matching context, reused while captures stay on one origin."""
+        key = ("mobile" if device_type == "mobile" else "desktop", block, color_scheme)
+        origin = urlsplit(url)[:2]
+        cached = self._pages.pop(key, None)
+        if cached is not None:
+            cached_origin, page = cached
+            if cached_origin == origin and not page.is_closed():
+                # Drop the previous capture's entries; navigation timing and
+                # paints reset with the new document.
+                page.evaluate("() => { performance.clearResourceTimings(); performance.clearMarks(); }")
+                self._pages[key] = (origin, page)
+                return page
+            try:
+                page.close()
+            except Exception:
+                pass
+        page = self._context(device_type, block, color_scheme).new_page()
+        self._pages[key] = (origin, page)
+        return page
+
+    def _drop_page(self, page: Page) -> None:
+        for key, (_, cached) in list(self._pages.items()):
+            if cached is page:
+                del self._pages[key]
+        try:
+            page.close()
+        except Exception:
+            pass
+
     def capture(
         self,
         url: str,
         output_path: Path,
         device_type: Literal["desktop", "mobile"] = "desktop",
         timeout_ms: int = 20000,
+        block: frozenset[str] = frozenset(),
+        wait_idle: bool = True,
+        use_cdp: bool = False,
+        color_scheme: Literal["light", "dark", "no-preference"] = "light",
     ) -> dict:
         """
         Captures a screenshot and extracts performance metrics.
         Returns a dictionary with 'ok', 'error', 'path', 'metrics'.
+
+        `block` lists Playwright resource types to abort (e.g. "image",
+        "font", "media") plus "analytics" for known tracking hosts; useful for
+        metrics-only or above-the-fold captures. Blocking captures only wait
+        for DOMContentLoaded; otherwise the page waits for load and, with
+        `wait_idle`, up to IDLE_TIMEOUT_MS more for network idle. The phase
+        reached is logged and returned as 'load_phase'.
+
+        The screenshot format follows output_path: .jpg/.jpeg is written as
+        JPEG_QUALITY JPEG, anything else as PNG. `use_cdp` captures through a
+        raw CDP Page.captureScreenshot call instead of page.screenshot.
+
+        Pages render with `color_scheme` (light by default, for stable shots).
+        Captures with the same device_type, block set and color_scheme share
+        one browser context (and so its cookies and cache) for the lifetime
+        of the verifier, and consecutive same-origin captures share a page.
         """
-        if not PLAYWRIGHT_AVAILABLE or not self._browser:
+        if not PLAYWRIGHT_AVAILABLE or not (self._browser or (self._playwright and self._cache_dir)):
             return {
                 "ok": False,
                 "error": "playwright_not_installed_or_initialized",
@@ -79,75 +270,64 @@ class VisualVerifier:
         
         output_path.parent.mkdir(parents=True, exist_ok=True)
         metrics = {"load_time_ms": None, "fcp_ms": None}
+        page = None
 
         try:
-            # Device Profiles
-            if device_type == "mobile":
-                # iPhone 13/14 Pro-ish
-                viewport = {"width": 390, "height": 844}
-                device_scale_factor = 3
-                is_mobile = True
-                has_touch = True
-                user_agent = "Mozilla/5.0 (iPhone; CPU iPhone OS 16_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.6 Mobile/15E148 Safari/604.1"
-            else:
-                # Standard Desktop
-                viewport = {"width": 1280, "height": 720}
-                device_scale_factor = 1
-                is_mobile = False
-                has_touch = False
-                user_agent = "VisualVerifier/1.0 (Desktop; +bot)"
-
-            context = self._browser.new_context(
-                viewport=viewport,
-                device_scale_factor=device_scale_factor,
-                is_mobile=is_mobile,
-                has_touch=has_touch,
-                user_agent=user_agent,
-                locale="en-US",
-                timezone_id="UTC",
-            )
-            
-            page = context.new_page()
+            viewport = _DEVICE_PROFILES["mobile" if device_type == "mobile" else "desktop"]["viewport"]
+            block = frozenset(block)
+            page = self._page(url, device_type, block, color_scheme)
             
-            # Navigate
+            # Navigate: wait for load, then allow a short, bounded network-idle
+            # window; pages with beacons or long-polling never go fully idle.
+            load_phase = "domcontentloaded" if block else "load"
             try:
-                page.goto(url, wait_until="networkidle", timeout=timeout_ms)
+                page.goto(url, wait_until=load_phase, timeout=timeout_ms)
             except PlaywrightTimeout:
+                load_phase = "timeout"
                 logger.warning(f"Timeout loading {url}, state detailed capture may be partial.")
+            if wait_idle and load_phase == "load":
+                try:
+                    page.wait_for_load_state("networkidle", timeout=IDLE_TIMEOUT_MS)
+                    load_phase = "networkidle"
+                except PlaywrightTimeout:
+                    pass
+            logger.info(f"Visual capture {url} ({device_type}): reached {load_phase}")
             
-            # Extract Metrics using Navigation Timing API
-            try:
-                perf_entry = page.evaluate("() => JSON.stringify(performance.getEntriesByType('navigation')[0])")
-                paint_entry = page.evaluate("() => JSON.stringify(performance.getEntriesByType('paint'))")
-                
-                if perf_entry:
-                    pdata = json.loads(perf_entry)
-                    if pdata.get("loadEventEnd") and pdata.get("startTime") is not None:
-                        metrics["load_time_ms"] = int(pdata["loadEventEnd"])
-                
-                if paint_entry:
-                    paints = json.loads(paint_entry)
-                    for pt in paints:
-                        if pt.get("name") == "first-contentful-paint":
-                             metrics["fcp_ms"] = int(pt.get("startTime", 0))
-                             break
-            except Exception:
-                pass
-
-            # Web vitals (LCP / CLS) if available
-            if measure_vitals:
+            # Start the vitals window in the page and take the screenshot
+            # while it runs; the combined evaluate below awaits the result.
+            if VITALS_START:
                 try:
-                    vitals = measure_vitals(page)
-                    if isinstance(vitals, dict):
-                        metrics["lcp"] = vitals.get("lcp")
-                        metrics["cls"] = vitals.get("cls")
+                    page.evaluate(VITALS_START)
                 except Exception:
                     pass
 
-            # Standardize rendering before snap
-            page.emulate_media(color_scheme="light")
-            page.screenshot(path=str(output_path), full_page=False)
-            context.close()
+            jpeg = output_path.suffix.lower() in (".jpg", ".jpeg")
+            if use_cdp:
+                params = {"format": "jpeg", "quality": JPEG_QUALITY} if jpeg else {"format": "png"}
+                session = page.context.new_cdp_session(page)
+                try:
+                    shot = session.send("Page.captureScreenshot", {**params, "fromSurface": False})
+                finally:
+                    session.detach()
+                output_path.write_bytes(base64.b64decode(shot["data"]))
+            elif jpeg:
+                page.screenshot(path=str(output_path), type="jpeg", quality=JPEG_QUALITY, full_page=False)
+            else:
+                page.screenshot(path=str(output_path), full_page=False)
+
+            # Navigation/paint timing and web vitals (LCP / CLS) in one evaluate
+            if COMBINED_METRICS_SNIPPET:
+                try:
+                    combined = page.evaluate(COMBINED_METRICS_SNIPPET)
+                    if isinstance(combined, dict):
+                        if combined.get("loadEventEnd"):
+                            metrics["load_time_ms"] = int(combined["loadEventEnd"])
+                        if combined.get("fcp") is not None:
+                            metrics["fcp_ms"] = int(combined["fcp"])
+                        metrics["lcp"] = combined.get("lcp")
+                        metrics["cls"] = combined.get("cls")
+                except Exception:
+                    pass
             
             return {
                 "ok": True,
@@ -155,14 +335,96 @@ class VisualVerifier:
                 "path": str(output_path),
                 "width": viewport["width"],
                 "height": viewport["height"],
+                "load_phase": load_phase,
                 "metrics": metrics,
             }
 
         except Exception as e:
             logger.error(f"Visual capture error: {e}")
+            if page is not None:
+                self._drop_page(page)
             return {
                 "ok": False,
                 "error": str(e),
                 "path": None,
                 "metrics": {},
             }
+
+
+class VisualVerifierPool:
+    """
+    Long-lived VisualVerifier workers fed from a shared queue.
+
+    Playwright's sync API is bound to the thread that started it, so each
+    worker thread enters, uses and closes its own verifier (and browser).
+    Every browser costs roughly 200 MB plus its contexts; size the pool to
+    the RAM available rather than to CPUs alone.
+    """
+
+    def __init__(self, size: Optional[int] = None, headless: bool = True, cache_dir: Optional[str | Path] = None):
+        self._size = max(1, size or (os.cpu_count() or 2) // 2)
+        self._headless = headless
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        self._tasks: queue.Queue = queue.Queue()
+        self._threads: list[threading.Thread] = []
+
+    def __enter__(self) -> "VisualVerifierPool":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def start(self) -> None:
+        if self._threads:
+            return
+        for i in range(self._size):
+            t = threading.Thread(target=self._worker, args=(i,), name=f"visual-verifier-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def close(self) -> None:
+        for _ in self._threads:
+            self._tasks.put(None)
+        for t in self._threads:
+            t.join()
+        self._threads.clear()
+
+    def _worker(self, index: int) -> None:
+        # Workers cannot share persistent profiles, so each gets its own.
+        cache_dir = self._cache_dir / f"worker-{index}" if self._cache_dir else None
+        vv = VisualVerifier(headless=self._headless, cache_dir=cache_dir)
+        try:
+            vv.__enter__()
+        except Exception as e:
+            # Keep draining the queue; capture() reports the missing browser.
+            logger.error(f"Visual verifier launch failed: {e}")
+        try:
+            while True:
+                item = self._tasks.get()
+                if item is None:
+                    break
+                index, job, results = item
+                try:
+                    res = vv.capture(*job)
+                except Exception as e:
+                    res = {"ok": False, "error": str(e), "path": None, "metrics": {}}
+                results.put((index, res))
+        finally:
+            vv.__exit__(None, None, None)
+
+    def capture_many(self, jobs: list[tuple]) -> list[dict]:
+        """
+        Captures every job, a VisualVerifier.capture argument tuple
+        (url, output_path, device_type, ...), across the pool.
+        Results are returned in job order.
+        """
+        self.start()
+        results: queue.Queue = queue.Queue()
+        for index, job in enumerate(jobs):
+            self._tasks.put((index, job, results))
+        out: list[dict] = [{}] * len(jobs)
+        for _ in jobs:
+            index, res = results.get()
+            out[index] = res
+        return out
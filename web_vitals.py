@@ -16,12 +16,17 @@ VITALS_SNIPPET = r"""
             cls: 0,
             fid: 0
         };
+        const started = performance.now();
+        let lcpFired = false;
+        let lastShiftTime = started;
+        let done = false;
         
         // LCP
         const lcpObserver = new PerformanceObserver((entryList) => {
             const entries = entryList.getEntries();
             const lastEntry = entries[entries.length - 1];
             metrics.lcp = lastEntry.startTime;
+            lcpFired = true;
         });
         try { lcpObserver.observe({type: 'largest-contentful-paint', buffered: true}); } catch(e){}
 
@@ -32,24 +37,87 @@ VITALS_SNIPPET = r"""
                 if (!entry.hadRecentInput) {
                     clsValue += entry.value;
                 }
+                lastShiftTime = Math.max(lastShiftTime, entry.startTime);
             }
             metrics.cls = clsValue;
         });
         try { clsObserver.observe({type: 'layout-shift', buffered: true}); } catch(e){}
 
-        // Resolve after 2 seconds (short observation window for audit)
-        setTimeout(() => {
+        const finish = () => {
+            if (done) return;
+            done = true;
+            clearInterval(poll);
+            clearTimeout(cap);
+            try { lcpObserver.disconnect(); clsObserver.disconnect(); } catch(e){}
             resolve(metrics);
-        }, 2000);
+        };
+
+        // A loaded page with nothing to paint never produces an LCP entry.
+        const isBlank = () => {
+            const body = document.body;
+            return !body || (!body.innerText.trim()
+                && !document.querySelector('img, svg, video, canvas, iframe'));
+        };
+
+        // Resolve once LCP is in and layout has been quiet for 300 ms,
+        // snapshotting on the next idle period; never wait past 2 seconds.
+        const idle = window.requestIdleCallback || ((cb) => setTimeout(cb, 0));
+        let settling = false;
+        const poll = setInterval(() => {
+            if (settling) return;
+            if (!lcpFired) {
+                // Give buffered entries a moment to arrive before giving up.
+                if (performance.now() - started > 100
+                        && document.readyState === 'complete' && isBlank()) {
+                    finish();
+                }
+                return;
+            }
+            if (performance.now() - lastShiftTime <= 300) return;
+            settling = true;
+            idle(finish, {timeout: 100});
+        }, 50);
+        const cap = setTimeout(finish, 2000);
     });
 }
 """
 
+# Installed once per browser context (context.add_init_script) so pages only
+# receive the short VITALS_INVOKE call instead of the full observer source.
+VITALS_INSTALL_SNIPPET = "window.__astraVitals = " + VITALS_SNIPPET.strip() + ";"
+VITALS_INVOKE = "() => window.__astraVitals()"
+# Starts the observation window without waiting on it, so other page work
+# (e.g. a screenshot) overlaps it; COMBINED_METRICS_SNIPPET awaits the result.
+VITALS_START = "() => { window.__astraVitalsPending = window.__astraVitals ? window.__astraVitals() : null; }"
+
+# Vitals plus navigation/paint timing in a single round trip. Values come back
+# as primitives; Playwright serializes them, so no JSON.stringify is needed.
+# Requires VITALS_INSTALL_SNIPPET on the page's context.
+COMBINED_METRICS_SNIPPET = r"""
+async () => {
+    const pending = window.__astraVitalsPending
+        || (window.__astraVitals ? window.__astraVitals() : null);
+    window.__astraVitalsPending = null;
+    const vitals = pending ? await pending : {lcp: null, cls: null, fid: null};
+    const nav = performance.getEntriesByType('navigation')[0];
+    const fcp = performance.getEntriesByType('paint')
+        .find((entry) => entry.name === 'first-contentful-paint');
+    return {
+        loadEventEnd: nav ? nav.loadEventEnd : null,
+        fcp: fcp ? fcp.startTime : null,
+        lcp: vitals.lcp,
+        cls: vitals.cls,
+        fid: vitals.fid
+    };
+}
+"""
+
 def measure_vitals(page) -> dict:
     """
     Injects observer and returns LCP/CLS metrics.
     Requires an active Playwright page object.
-    Blocks for 2 seconds.
+    Blocks until LCP has settled, for at most 2 seconds; returns zeros at
+    once for a loaded page with nothing to paint.
     """
     try:
         # We need to reload or just wait if page is already loaded?